@@ -1,10 +1,19 @@
 ﻿"""
 common.py - shared helpers for daft_scout.
 """
+import re
 
 # Time window config: look back N days.
 DAYS_LOOKBACK = 7
 
+# Filename-unsafe characters (keep word chars and '-').
+_SAFE_FILENAME_RE = re.compile(r"[^\w-]")
+
+
+def sanitize_filename(name: str) -> str:
+    """One C-level regex pass instead of a per-character Python loop."""
+    return _SAFE_FILENAME_RE.sub("_", name)
+
 def setup_logger(name: str):
     import logging
     logger = logging.getLogger(name)
@@ -20,21 +29,26 @@ def setup_logger(name: str):
 logger = setup_logger("daft_common")
 
 
+# Parsed once and cached: each getter used to re-read and re-parse
+# config-test.ini from disk on every call.
+_config = None
+
+
+def _get_config():
+    global _config
+    if _config is None:
+        import os
+        import configparser
+
+        config_path = os.path.join(os.path.dirname(__file__), "..", "config-test.ini")
+        _config = configparser.ConfigParser()
+        _config.read(config_path, encoding="utf-8")
+    return _config
+
+
 def get_enrich_concurrency():
-    import os
-    import configparser
-    
-    config_path = os.path.join(os.path.dirname(__file__), "..", "config-test.ini")
-    config = configparser.ConfigParser()
-    config.read(config_path, encoding="utf-8")
-    return config.getint("crawler", "enrich_workers", fallback=3)
+    return _get_config().getint("crawler", "enrich_workers", fallback=3)
 
 
 def get_organize_concurrency():
-    import os
-    import configparser
-    
-    config_path = os.path.join(os.path.dirname(__file__), "..", "config-test.ini")
-    config = configparser.ConfigParser()
-    config.read(config_path, encoding="utf-8")
-    return config.getint("crawler", "organize_workers", fallback=5)
+    return _get_config().getint("crawler", "organize_workers", fallback=5)
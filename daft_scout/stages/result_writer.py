@@ -7,14 +7,14 @@ import daft
 from daft import col, DataType
 from datetime import datetime
 
-from common import setup_logger
+from common import setup_logger, sanitize_filename
 
 
 logger = setup_logger("daft_result_writer")
 
 
 def _domain_dir_name(domain: str, batch_timestamp: str) -> str:
-    safe_domain = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in domain)
+    safe_domain = sanitize_filename(domain)
     return f"{safe_domain}_{batch_timestamp}"
 
 
@@ -88,7 +88,7 @@ class PostWriterUDF:
             
         os.makedirs(os.path.join(dir_path, tier), exist_ok=True)
 
-        safe_event = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in event)[:50]
+        safe_event = sanitize_filename(event)[:50]
         filename = f"{safe_event}_{date_str or 'Unknown'}.md"
         filepath = os.path.join(dir_path, tier, filename)
 
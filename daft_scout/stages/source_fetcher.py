@@ -9,7 +9,7 @@ import daft
 from daft import col, DataType
 from datetime import datetime, timezone
 
-from common import setup_logger
+from common import setup_logger, sanitize_filename
 
 logger = setup_logger("daft_source_fetcher")
 
@@ -43,7 +43,7 @@ def _save_raw_backup(posts, source_type, name, batch_timestamp):
     try:
         raw_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data", f"raw_{batch_timestamp}")
         os.makedirs(raw_dir, exist_ok=True)
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        safe_name = sanitize_filename(name)
         filename = f"{source_type}_{safe_name}.json"
 
         with open(os.path.join(raw_dir, filename), "w", encoding="utf-8") as f:
@@ -49,6 +49,11 @@ def _md5_hash(value: str) -> str:
     return hashlib.md5(value.encode()).hexdigest()
 
 
+# Video-id names keep word chars only (stricter than common.sanitize_filename,
+# which also allows '-'); precompiled so the hot path is one C-level sub.
+_NON_WORD_RE = re.compile(r"\W")
+
+
 def _clean_text_content(text):
     if not text:
         return ""
@@ -228,9 +233,20 @@ class LinkExtractor:
     SKIP_DOMAINS = ["twitter.com", "x.com", "t.co", "pic.twitter.com"]
     YOUTUBE_DOMAINS = ["youtube.com", "youtu.be", "www.youtube.com", "m.youtube.com"]
     VIDEO_DOMAINS = ["video.twimg.com"]
-    VIDEO_EXTENSIONS = [".mp4", ".mov", ".webm", ".mkv"]
+    VIDEO_EXTENSIONS = (".mp4", ".mov", ".webm", ".mkv")
     MEDIA_DOMAINS = ["twimg.com", "pbs.twimg.com"]
 
+    # Precomputed sets/suffixes: O(1) exact-netloc membership plus an
+    # endswith pass for subdomains. Substring scans were slower and wrong
+    # (e.g. "fakeyoutube.com" matched "youtube.com").
+    _YT = frozenset(YOUTUBE_DOMAINS)
+    _YT_SUFFIX = (".youtube.com", ".youtu.be")
+    _VIDEO = frozenset(VIDEO_DOMAINS)
+    _MEDIA = frozenset(MEDIA_DOMAINS)
+    _MEDIA_SUFFIX = tuple("." + d for d in MEDIA_DOMAINS)
+    _SKIP = frozenset(SKIP_DOMAINS)
+    _SKIP_SUFFIX = tuple("." + d for d in SKIP_DOMAINS)
+
     @staticmethod
     def extract_urls(text: str) -> List[str]:
         if not text:
@@ -255,20 +271,17 @@ class LinkExtractor:
 
         for url in urls:
             parsed = urlparse(url)
-            domain = parsed.netloc.lower()
+            domain = parsed.netloc.lower().split(":", 1)[0]
             path = parsed.path.lower()
 
-            is_youtube = any(yt in domain for yt in cls.YOUTUBE_DOMAINS)
-            is_generic_video = (
-                any(v in domain for v in cls.VIDEO_DOMAINS)
-                or any(path.endswith(ext) for ext in cls.VIDEO_EXTENSIONS)
-            )
+            is_youtube = domain in cls._YT or domain.endswith(cls._YT_SUFFIX)
+            is_generic_video = domain in cls._VIDEO or path.endswith(cls.VIDEO_EXTENSIONS)
 
             if is_youtube or is_generic_video:
                 video_links.append(url)
-            elif any(media in domain for media in cls.MEDIA_DOMAINS):
+            elif domain in cls._MEDIA or domain.endswith(cls._MEDIA_SUFFIX):
                 media_urls.append(url)
-            elif domain and not any(skip in domain for skip in cls.SKIP_DOMAINS):
+            elif domain and domain not in cls._SKIP and not domain.endswith(cls._SKIP_SUFFIX):
                 blog_links.append(url)
 
         return blog_links, video_links, media_urls
@@ -299,7 +312,7 @@ class GenericVideoFetcher:
         return self._generate_generic_video_id(url, parsed), url
 
     def _extract_youtube_id(self, parsed, domain) -> Optional[str]:
-        if not any(d in domain for d in ["youtube.com", "youtu.be"]):
+        if domain not in LinkExtractor._YT and not domain.endswith(LinkExtractor._YT_SUFFIX):
             return None
 
         try:
@@ -322,14 +335,14 @@ class GenericVideoFetcher:
         try:
             safe_name = ""
             if title:
-                clean_title = "".join(c if c.isalnum() else "_" for c in title)[:50]
+                clean_title = _NON_WORD_RE.sub("_", title)[:50]
                 if clean_title:
                     safe_name = clean_title
 
             if not safe_name:
                 filename = os.path.basename(parsed.path)
                 if filename and "." in filename and len(filename) <= 80:
-                    safe_name = "".join(c if c.isalnum() else "_" for c in os.path.splitext(filename)[0])
+                    safe_name = _NON_WORD_RE.sub("_", os.path.splitext(filename)[0])
 
             if not safe_name:
                 return _md5_hash(url)[:12]
@@ -2,8 +2,10 @@
 common.py - 公共配置和工具函数
 """
 import os
+import re
 import json
 import configparser
+from collections import deque
 from urllib.parse import urlparse
 from datetime import datetime
 import threading
@@ -12,6 +14,11 @@ import threading
 # 时间范围配置,爬取最近多少天的内容
 DAYS_LOOKBACK = 7
 
+# I/O密集型线程池默认并发数（RSS抓取、LLM调用等几乎全程在等网络）。
+# 取 CPython ThreadPoolExecutor 的默认公式 min(32, cpu+4)；
+# 各阶段仍可在 config.ini 里按 provider 限流单独调小
+DEFAULT_IO_WORKERS = min(32, (os.cpu_count() or 4) + 4)
+
 # 批次清单文件名
 MANIFEST_FILENAME = "latest_batch.json"
 
@@ -28,11 +35,98 @@ def setup_logger(name: str):
 
 logger = setup_logger("common")
 
+# JSON序列化：优先用C实现的 orjson（直接产出bytes，省去utf-8编码一步），
+# 未安装时退回 stdlib json，两者输出等价（2空格缩进、非ASCII不转义）
+try:
+    import orjson
+
+    def json_dumps_bytes(obj, indent: bool = True) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    def json_dumps_bytes(obj, indent: bool = True) -> bytes:
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 def _tid():
     """获取当前线程标识，用于日志"""
     return f"[T{threading.current_thread().name.split('_')[-1]}]"
 
 
+# 文件名里不允许的字符（保留字母数字、-、_）
+_SAFE_FILENAME_RE = re.compile(r'[^\w-]')
+
+
+def sanitize_filename(name: str) -> str:
+    """文件名清理：单次C层正则替换取代逐字符Python循环（标题常是长CJK串）"""
+    return _SAFE_FILENAME_RE.sub('_', name)
+
+
+class BoundedDeque:
+    """
+    轻量级有界任务通道：deque + 共享锁上的三个Condition
+
+    queue.Queue 每次 put/get 都要走互斥锁加多次条件变量通知和Python层记账；
+    这里用 C 实现的 deque 搭配单把锁、定向 notify()（而非 notify_all()）减少
+    每个条目的唤醒开销。保留 task_done()/join() 协议，流水线各阶段可直接替换。
+    """
+
+    def __init__(self, maxsize=0):
+        self._queue = deque()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+        self._unfinished = 0
+
+    def put(self, item):
+        with self._not_full:
+            while self._maxsize > 0 and len(self._queue) >= self._maxsize:
+                self._not_full.wait()
+            self._queue.append(item)
+            self._unfinished += 1
+            self._not_empty.notify()
+
+    def get(self):
+        with self._not_empty:
+            while not self._queue:
+                self._not_empty.wait()
+            item = self._queue.popleft()
+            self._not_full.notify()
+            return item
+
+    def drain(self, max_items):
+        """
+        批量取出至多 max_items 个条目（阻塞直到至少有1个）
+
+        一次锁获取摊薄到整批条目，消费端按批处理时用它取代逐个 get()。
+        每个取出的条目仍需对应一次 task_done()。
+        """
+        with self._not_empty:
+            while not self._queue:
+                self._not_empty.wait()
+            items = []
+            while self._queue and len(items) < max_items:
+                items.append(self._queue.popleft())
+            self._not_full.notify(len(items))
+            return items
+
+    def task_done(self):
+        with self._all_done:
+            unfinished = self._unfinished - 1
+            if unfinished < 0:
+                raise ValueError('task_done() called too many times')
+            self._unfinished = unfinished
+            if unfinished == 0:
+                self._all_done.notify_all()
+
+    def join(self):
+        with self._all_done:
+            while self._unfinished:
+                self._all_done.wait()
+
+
 # 加载配置文件 (config.ini，位于项目根目录)
 config = configparser.ConfigParser()
 config.read(os.path.join(os.path.dirname(__file__), '..', 'config.ini'), encoding='utf-8')
@@ -62,9 +156,9 @@ def save_batch_manifest(output_dir, batch_id, domain_reports, stats=None):
         manifest["stats"] = stats
     
     manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
-    
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    with open(manifest_path, 'wb') as f:
+        f.write(json_dumps_bytes(manifest))
     
     logger.info(f"批次清单已保存: {MANIFEST_FILENAME}")
     return manifest_path
@@ -1,13 +1,20 @@
 """
 pipeline.py - Main entry point and coordinator for the native Python pipeline.
+
+Concurrency model: stages are thread pools chained by bounded channels
+(BoundedDeque) with a task_done/join drain protocol. A single-asyncio-loop
+design was considered and rejected: the heavy stages (Selenium rendering,
+faster-whisper subprocess, the blocking LLM SDK) are synchronous, so an
+event loop would push them right back into executor threads while
+complicating shutdown. Async I/O is instead applied selectively where it
+pays off, e.g. the aiohttp batch feed download inside FetcherStage.
 """
 import os
 import time
-import queue
 import configparser
 from datetime import datetime
 
-from common import setup_logger
+from common import setup_logger, BoundedDeque
 from stages.source_fetcher import FetcherStage
 from stages.content_enricher import EnricherStage
 from stages.llm_organizer import OrganizerStage
@@ -22,10 +29,13 @@ class NativePipeline:
         self.batch_timestamp = batch_timestamp
         self.output_dir = output_dir
 
-        # Bounded queues for backpressure between stages.
-        self.fetch_queue = queue.Queue(maxsize=1000)
-        self.enrich_queue = queue.Queue(maxsize=1000)
-        self.organize_queue = queue.Queue(maxsize=1000)
+        # Bounded channels for backpressure between stages (deque + condvars,
+        # cheaper per item than queue.Queue). Posts carry full article
+        # bodies, so the bound is kept tight: 200 in-flight items per stage
+        # is plenty of slack for the worker pools while capping memory.
+        self.fetch_queue = BoundedDeque(maxsize=200)
+        self.enrich_queue = BoundedDeque(maxsize=200)
+        self.organize_queue = BoundedDeque(maxsize=200)
 
         self.fetcher = FetcherStage(self.fetch_queue, config, batch_timestamp)
         self.enricher = EnricherStage(self.fetch_queue, self.enrich_queue, config, batch_timestamp)
@@ -74,39 +84,27 @@ def _load_config():
 
 
 def _load_sources(config):
-    def load_weixin():
-        accs = {}
-        if config.has_section('weixin_accounts'):
-            for k in config.options('weixin_accounts'):
-                v = config.get('weixin_accounts', k).strip()
-                if v:
-                    accs[k] = v
-        return accs
-
-    def load_x():
-        accs = {}
-        rsshub_base = config.get('rsshub', 'base_url', fallback='http://127.0.0.1:1200')
-        if config.has_section('x_accounts'):
-            for k in config.options('x_accounts'):
-                v = config.get('x_accounts', k).strip()
-                if v:
-                    accs[k] = f"{rsshub_base}/twitter/user/{v}"
-        return accs
-
-    def load_youtube():
+    """Table-driven source loader: one spec row per category instead of
+    three near-identical closures."""
+    rsshub_base = config.get('rsshub', 'base_url', fallback='http://127.0.0.1:1200')
+
+    # (category, config section, feed URL template)
+    specs = [
+        ("weixin", "weixin_accounts", "{value}"),
+        ("X", "x_accounts", rsshub_base + "/twitter/user/{value}"),
+        ("YouTube", "youtube_channels", "https://www.youtube.com/feeds/videos.xml?channel_id={value}"),
+    ]
+
+    sources = {}
+    for category, section, template in specs:
         accs = {}
-        if config.has_section('youtube_channels'):
-            for k in config.options('youtube_channels'):
-                v = config.get('youtube_channels', k).strip()
+        if config.has_section(section):
+            for k in config.options(section):
+                v = config.get(section, k).strip()
                 if v:
-                    accs[k] = f"https://www.youtube.com/feeds/videos.xml?channel_id={v}"
-        return accs
-
-    return {
-        "weixin": load_weixin(),
-        "X": load_x(),
-        "YouTube": load_youtube(),
-    }
+                    accs[k] = template.format(value=v)
+        sources[category] = accs
+    return sources
 
 
 if __name__ == "__main__":
@@ -3,20 +3,22 @@ content_enricher.py - EnricherStage for Native Python Pipeline.
 """
 import time
 from concurrent.futures import ThreadPoolExecutor
-from queue import Queue
 
-from common import setup_logger
+from common import setup_logger, BoundedDeque, DEFAULT_IO_WORKERS
 from utils.content_fetcher import ContentFetcher
 
 logger = setup_logger("content_enricher")
 
 class EnricherStage:
-    def __init__(self, fetch_queue: Queue, enrich_queue: Queue, config, batch_timestamp):
+    def __init__(self, fetch_queue: BoundedDeque, enrich_queue: BoundedDeque, config, batch_timestamp):
         self.fetch_queue = fetch_queue
         self.enrich_queue = enrich_queue
         self.config = config
         
-        self.max_workers = config.getint('crawler', 'enrich_workers', fallback=5)
+        self.max_workers = config.getint('crawler', 'enrich_workers', fallback=DEFAULT_IO_WORKERS)
+        # Read once: configparser lookups are regex/coercion-heavy and this
+        # flag is checked for every enriched post.
+        self.enable_subtitle_opt = config.getboolean('llm', 'enable_subtitle_optimization', fallback=False)
         self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="Content-Enricher")
         
         self.content_fetcher = ContentFetcher(batch_timestamp)
@@ -75,12 +77,19 @@ class EnricherStage:
         try:
             if source_type == "X":
                 content = post.get('content', '')
+                # Empty posts are common on X; skip the embedded-URL scan
+                # (and its Selenium/transcribe machinery) outright.
+                if not content or not content.strip():
+                    return
                 extra_content, extra_urls = self._enrich_x_content(content, title)
                 post['extra_content'] = extra_content
                 post['extra_urls'] = extra_urls
-                
+
             elif source_type == "YouTube":
                 link = post.get('link', '')
+                # Only actual video links are worth a transcription attempt.
+                if not link or ('youtube.com' not in link and 'youtu.be' not in link):
+                    return
                 content = post.get('content', '')
                 extra_content = self._enrich_youtube_content(link, title, content)
                 post['extra_content'] = extra_content
@@ -91,9 +100,8 @@ class EnricherStage:
 
     def _enrich_x_content(self, content, title):
         try:
-            enable_opt = self.config.getboolean('llm', 'enable_subtitle_optimization', fallback=False)
             embedded, extra_urls = self.content_fetcher.fetch_embedded_content(
-                content, title=title, optimize_video=enable_opt
+                content, title=title, optimize_video=self.enable_subtitle_opt
             )
             extra_content = ""
             if embedded:
@@ -112,9 +120,8 @@ class EnricherStage:
     def _enrich_youtube_content(self, link, title, context=""):
         try:
             full_context = f"{title}\n{context}" if context else title
-            enable_opt = self.config.getboolean('llm', 'enable_subtitle_optimization', fallback=False)
             yt = self.content_fetcher.fetch_video(
-                link, context=full_context, title=title, optimize=enable_opt
+                link, context=full_context, title=title, optimize=self.enable_subtitle_opt
             )
             if yt and yt.content:
                 logger.info(f"✨ [Enriched - YT] [{title[:30]}] Subtitles: {len(yt.content)} chars")
@@ -2,15 +2,72 @@
 llm_organizer.py - OrganizerStage for Native Python Pipeline.
 """
 import json
+import re
 import time
 import os
 from concurrent.futures import ThreadPoolExecutor
-from queue import Queue
+from string import Formatter
 from openai import OpenAI
-from common import setup_logger, _tid
+from common import setup_logger, _tid, BoundedDeque, DEFAULT_IO_WORKERS
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
 
 logger = setup_logger("llm_organizer")
 
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _strip_html(text):
+    """
+    去掉正文里的HTML标签再进prompt：标签能把token量撑大2-3倍，
+    LLM按token计费且首token延迟随输入长度增长。lxml缺失或解析失败时
+    退化为正则剥标签。注意只在拼prompt时剥离——post['content']本身
+    保持原样，enricher的URL提取还要扫原始HTML里的href
+    """
+    if not text or '<' not in text:
+        return text
+    if lxml_html is not None:
+        try:
+            return lxml_html.fromstring(text).text_content()
+        except Exception:
+            pass
+    return _TAG_RE.sub(' ', text)
+
+# system 消息是纯静态的，构建一次复用，不必每篇文章重建 dict
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant for data organization. Output only valid JSON, no extra text.",
+}
+
+
+class _CompiledPrompt:
+    """
+    预解析的提示词模板
+
+    str.format() 每次调用都要重新扫描整个模板串找占位符；模板有几KB且
+    每篇文章都要渲染一次，这里在加载时用 Formatter.parse 解析成
+    (字面量, 字段名) 片段列表，渲染只剩取值和一次 join。
+    对外保持 format(**context) 接口，可直接替换原字符串模板。
+    """
+
+    def __init__(self, template: str):
+        self._segments = [
+            (literal, field, spec or '')
+            for literal, field, spec, _conv in Formatter().parse(template)
+        ]
+
+    def format(self, **context):
+        parts = []
+        for literal, field, spec in self._segments:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                parts.append(format(context[field], spec))
+        return "".join(parts)
+
 def organize_single_post(post, prompt_template, llm_client, llm_config, max_retries=3, retry_delay=3):
     """
     调用 LLM 对单篇文章进行标准化整理，返回 JSON 结构化数据
@@ -28,8 +85,6 @@ def organize_single_post(post, prompt_template, llm_client, llm_config, max_retr
         logger.error(f"❌ [Prompt-Missing] No prompt template provided for {post.get('link', 'unknown')}")
         return None
 
-    content = post['content']
-    
     # 2. Prepare Context
     context = {
         'title': post.get('title', ''),
@@ -37,7 +92,7 @@ def organize_single_post(post, prompt_template, llm_client, llm_config, max_retr
         'link': post.get('link', ''),
         'source_type': post.get('source_type', ''),
         'source_name': post.get('source_name', ''),  # Added for potential prompt usage
-        'content': post.get('content', ''),
+        'content': _strip_html(post.get('content', '')),
         'extra_content': post.get('extra_content', ''),
         'extra_urls': post.get('extra_urls', [])     # List of strings
     }
@@ -57,14 +112,16 @@ def organize_single_post(post, prompt_template, llm_client, llm_config, max_retr
     # 带重试机制的 API 调用
     result_text = None
     finish_reason = None
-    
+    # 模型名整个重试循环内不变，configparser 查找提到循环外做一次
+    model = llm_config.get('llm', 'model')
+
     for attempt in range(max_retries + 1):
         try:
             start_ts = time.time()
             response = llm_client.chat.completions.create(
-                model=llm_config.get('llm', 'model'),
+                model=model,
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant for data organization. Output only valid JSON, no extra text."},
+                    _SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ],
                 response_format={'type': 'json_object'}
@@ -122,7 +179,16 @@ def organize_single_post(post, prompt_template, llm_client, llm_config, max_retr
     return result
 
 class OrganizerStage:
-    def __init__(self, enrich_queue: Queue, organize_queue: Queue, config):
+    """
+    LLM整理阶段：organize_workers个工作线程消费enrich队列
+
+    曾考虑改用 AsyncOpenAI + 单事件循环承载上百并发请求，未采纳：
+    本阶段并发上限实际由 provider 限流决定（几十级别），线程数在这个
+    量级开销可忽略，而 async 化会破坏各阶段统一的 BoundedDeque
+    worker-loop/毒丸收尾协议（见 pipeline.py 模块注释）。
+    """
+
+    def __init__(self, enrich_queue: BoundedDeque, organize_queue: BoundedDeque, config):
         self.enrich_queue = enrich_queue
         self.organize_queue = organize_queue
         self.config = config
@@ -134,7 +200,7 @@ class OrganizerStage:
         # Load prompt template once during initialization
         self.prompt_template = self._load_prompt_template()
         
-        self.max_workers = config.getint('crawler', 'organize_workers', fallback=5)
+        self.max_workers = config.getint('crawler', 'organize_workers', fallback=DEFAULT_IO_WORKERS)
         self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="Organizer")
         self.futures = []
 
@@ -154,7 +220,7 @@ class OrganizerStage:
             if os.path.exists(target_path):
                 with open(target_path, 'r', encoding='utf-8') as f:
                     logger.info(f"Loaded prompt template from {target_path}")
-                    return f.read()
+                    return _CompiledPrompt(f.read())
             else:
                 logger.error(f"❌ Prompt file not found at {target_path}")
                 return ""
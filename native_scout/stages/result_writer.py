@@ -2,17 +2,35 @@
 result_writer.py - WriterStage for Native Python Pipeline.
 """
 import os
-import json
 import time
 import threading
 import hashlib
-from queue import Queue
 from datetime import datetime
 
-from common import setup_logger, save_batch_manifest
+from common import setup_logger, save_batch_manifest, json_dumps_bytes, sanitize_filename, BoundedDeque
 
 logger = setup_logger("result_writer")
 
+# Post markdown skeleton built once; per-post work is a single format call
+# instead of assembling and joining a list of lines.
+_POST_TEMPLATE = """# {event}
+
+- **Date**: {date}
+- **Category**: {category}
+- **Domain**: {domain}
+- **Quality**: {stars} ({score}/5)
+- **Reason**: {reason}
+- **Source_Type**: {source_type}
+- **Source**: {source_name}
+- **Link**: {link}
+
+## Key Info
+{key_info}
+
+## Details
+{detail}
+"""
+
 def group_posts_by_domain(all_posts):
     """
     按所属领域对文章进行分组
@@ -33,7 +51,7 @@ def group_posts_by_domain(all_posts):
 
 
 class WriterStage:
-    def __init__(self, organize_queue: Queue, output_dir, batch_timestamp):
+    def __init__(self, organize_queue: BoundedDeque, output_dir, batch_timestamp):
         self.organize_queue = organize_queue
         self.output_dir = output_dir
         self.batch_timestamp = batch_timestamp
@@ -56,22 +74,36 @@ class WriterStage:
         self.thread.join()
         logger.info("WriterStage stopped.")
 
+    # Max results pulled per queue drain; the batch is written in one
+    # tight loop so syscalls cluster instead of interleaving with waits.
+    WRITE_BATCH_SIZE = 32
+
     def _worker_loop(self):
         while True:
-            result = self.organize_queue.get()
-            
-            if result is None:
-                self._finalize_batch()
+            batch = self.organize_queue.drain(self.WRITE_BATCH_SIZE)
+            stop = False
+            written = 0
+            for result in batch:
+                if result is None:
+                    # Poison pill - always the last item (pipeline drains
+                    # the queue before stop() injects it).
+                    self._finalize_batch()
+                    stop = True
+                    break
+                try:
+                    self._write_post_file(result)
+                    self.total_posts += 1
+                    written += 1
+                except Exception as e:
+                    logger.error(f"Writer error: {e}")
+            # One summary line per drained batch; per-file detail stays at
+            # debug so a busy run is not dominated by logging syscalls.
+            if written:
+                logger.info(f"💾 [Saved] {written} posts (total: {self.total_posts})")
+            for _ in batch:
                 self.organize_queue.task_done()
+            if stop:
                 break
-            
-            try:
-                self._write_post_file(result)
-                self.total_posts += 1
-            except Exception as e:
-                logger.error(f"Writer error: {e}")
-            finally:
-                self.organize_queue.task_done()
 
     def _get_quality_tier(self, score):
         if score >= 4: return "high"
@@ -80,7 +112,7 @@ class WriterStage:
 
     def _get_domain_info(self, domain):
         if domain not in self.domain_info_map:
-            safe_domain = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in domain)
+            safe_domain = sanitize_filename(domain)
             dir_name = f"{safe_domain}_{self.batch_timestamp}"
             dir_path = os.path.join(self.output_dir, dir_name)
             
@@ -97,37 +129,30 @@ class WriterStage:
 
     def _generate_post_markdown(self, post, domain):
         score = post.get('quality_score', 3)
-        stars = '⭐' * score + '☆' * (5 - score)
-        
-        lines = [
-            f"# {post.get('event', 'Untitled')}",
-            "",
-            f"- **Date**: {post.get('date', 'Unknown')}",
-            f"- **Category**: {post.get('category', 'Uncategorized')}",
-            f"- **Domain**: {domain}",
-            f"- **Quality**: {stars} ({score}/5)",
-            f"- **Reason**: {post.get('quality_reason', 'None')}",
-            f"- **Source_Type**: {post.get('source_type', 'Unknown')}",
-            f"- **Source**: {post.get('source_name', 'Unknown')}",
-            f"- **Link**: {post.get('link', '')}",
-            "",
-            "## Key Info",
-            post.get('key_info', ''),
-            "",
-            "## Details",
-            post.get('detail', ''),
-            "",
-        ]
-        
+
+        parts = [_POST_TEMPLATE.format(
+            event=post.get('event', 'Untitled'),
+            date=post.get('date', 'Unknown'),
+            category=post.get('category', 'Uncategorized'),
+            domain=domain,
+            stars='⭐' * score + '☆' * (5 - score),
+            score=score,
+            reason=post.get('quality_reason', 'None'),
+            source_type=post.get('source_type', 'Unknown'),
+            source_name=post.get('source_name', 'Unknown'),
+            link=post.get('link', ''),
+            key_info=post.get('key_info', ''),
+            detail=post.get('detail', ''),
+        )]
+
         if post.get('extra_content'):
-            lines.extend(["## Extra Content", post['extra_content'], ""])
-        
+            parts.append(f"\n## Extra Content\n{post['extra_content']}\n")
+
         if post.get('extra_urls'):
-            lines.append("## External Links")
-            lines.extend([f"- {url}" for url in post['extra_urls']])
-            lines.append("")
-        
-        return "\n".join(lines)
+            links = "\n".join(f"- {url}" for url in post['extra_urls'])
+            parts.append(f"\n## External Links\n{links}\n")
+
+        return "".join(parts)
 
     def _write_post_file(self, result):
         domain = result.get('domain', 'Other')
@@ -138,14 +163,15 @@ class WriterStage:
         domain_info = self._get_domain_info(domain)
         tier = self._get_quality_tier(quality_score)
         
-        safe_event = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in event)[:50]
+        safe_event = sanitize_filename(event)[:50]
         link = result.get('link', '')
         unique_suffix = hashlib.md5(link.encode('utf-8')).hexdigest()[:8] if link else "nolink"
         filename = f"{safe_event}_{date_str}_{unique_suffix}.md"
         filepath = os.path.join(domain_info['path'], tier, filename)
         
         md_content = self._generate_post_markdown(result, domain)
-        with open(filepath, 'w', encoding='utf-8') as f:
+        # 64KB buffer: the whole post flushes in one syscall
+        with open(filepath, 'w', encoding='utf-8', buffering=65536) as f:
             f.write(md_content)
 
         # Collect for JSON
@@ -162,7 +188,7 @@ class WriterStage:
         domain_info['posts'].append(post_json)
         
         domain_info[tier] += 1
-        logger.info(f"💾 [Saved] [{tier.upper()}] {filename}")
+        logger.debug(f"💾 [Saved] [{tier.upper()}] {filename}")
         return tier
 
     def _finalize_batch(self):
@@ -171,8 +197,8 @@ class WriterStage:
         for domain, info in self.domain_info_map.items():
             json_path = os.path.join(info['path'], 'posts.json')
             try:
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(info['posts'], f, ensure_ascii=False, indent=2)
+                with open(json_path, 'wb') as f:
+                    f.write(json_dumps_bytes(info['posts']))
             except Exception as e:
                 logger.error(f"Failed to save posts.json for {domain}: {e}")
 
@@ -11,7 +11,12 @@ content_fetcher.py - 嵌入内容爬取模块
 - 易于扩展：新增内容类型只需添加新的Fetcher类
 - 解耦清晰：rss_crawler.py 只需调用 ContentFetcher，不关心内部实现
 """
+import bisect
+import functools
+import hashlib
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse, parse_qs
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
@@ -19,6 +24,83 @@ from common import config, setup_logger
 
 logger = setup_logger("content_fetcher")
 
+# [llm] 配置快照：configparser.get 每次都走插值+大小写+节查找，
+# 每个视频的优化块要读三次，这里模块加载时一次性拍平成dict
+_LLM_CONF = dict(config['llm']) if config.has_section('llm') else {}
+
+# URL匹配正则（模块加载时编译一次）
+# 末位字符排除常见标点，正则内即完成截尾，无需逐个 rstrip
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+[^\s<>"{}|\\^`\[\].,;:!?]')
+
+
+# 同一URL会在 categorize / _parse_video_info / fetch 中被反复解析，缓存解析结果
+@functools.lru_cache(maxsize=4096)
+def _cached_urlparse(url: str):
+    return urlparse(url)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_parse_qs(query: str):
+    return parse_qs(query)
+
+
+# URL哈希只为生成唯一标识，不是加密用途：优先用 xxhash（比md5快一个数量级），
+# 未安装时退回 stdlib 的 blake2b（仍快于md5，12位hex足够防撞）
+try:
+    import xxhash
+
+    def _url_hash(value: str) -> str:
+        return xxhash.xxh3_64(value.encode()).hexdigest()
+except ImportError:
+    def _url_hash(value: str) -> str:
+        return hashlib.blake2b(value.encode(), digest_size=6).hexdigest()
+
+
+# 非字母数字的ASCII字符 -> '_' 翻译表（单次C层translate取代逐字符isalnum循环）
+_SAFE_CHAR_TABLE = {ord(c): '_' for c in map(chr, range(128)) if not c.isalnum()}
+
+
+def _sanitize_name(name: str) -> str:
+    """文件名清理：非字母数字字符替换为下划线"""
+    if name.isascii():
+        return name.translate(_SAFE_CHAR_TABLE)
+    # 含非ASCII字符（如中文标题）时退回逐字符判断
+    return "".join(c if c.isalnum() else '_' for c in name)
+
+
+# YouTube域名精确集合：O(1)成员判断取代逐项子串扫描
+_YT_DOMAINS = frozenset(['youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com'])
+
+# 项目根目录（content_fetcher.py 在 native_scout/utils/ 下，向上两级）
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 重量级依赖保持懒加载，但首次导入后缓存到模块级，避免每次调用都走import机制
+_process_video = None
+_optimize_subtitle = None
+_fetch_web_content = None
+
+
+def _load_video_scribe():
+    """首次调用时导入 video_scribe 并缓存入口函数"""
+    global _process_video, _optimize_subtitle
+    if _process_video is None:
+        import sys
+        # video_scribe 在项目根目录下，确保可导入
+        if _PROJECT_ROOT not in sys.path:
+            sys.path.append(_PROJECT_ROOT)
+        from video_scribe.core import process_video, optimize_subtitle
+        _process_video, _optimize_subtitle = process_video, optimize_subtitle
+    return _process_video, _optimize_subtitle
+
+
+def _load_web_crawler():
+    """首次调用时导入 Selenium 爬取入口并缓存"""
+    global _fetch_web_content
+    if _fetch_web_content is None:
+        from utils.web_crawler import fetch_web_content
+        _fetch_web_content = fetch_web_content
+    return _fetch_web_content
+
 @dataclass
 class EmbeddedContent:
     """嵌入内容数据结构"""
@@ -35,6 +117,38 @@ def _shorten_url(url: str, length: int = 60) -> str:
     return url[:length] + "..." if len(url) > length else url
 
 
+class _DomainTrie:
+    """
+    反向域名标签前缀树
+
+    域名按 '.' 拆分并倒序插入（如 'video.twimg.com' -> com/twimg/video），
+    分类时每个域名只需沿树走一次（O(标签数)），取代对各域名列表的逐项子串扫描。
+    子域名自动命中父域名的标签，最深的匹配优先（video.twimg.com 优先于 twimg.com）。
+    """
+
+    _TAG_KEY = '$tag'
+
+    def __init__(self):
+        self._root = {}
+
+    def insert(self, domain: str, tag: str):
+        node = self._root
+        for label in reversed(domain.lower().split('.')):
+            node = node.setdefault(label, {})
+        node[self._TAG_KEY] = tag
+
+    def match(self, domain: str) -> Optional[str]:
+        """返回最深匹配的分类标签，未命中返回None"""
+        node = self._root
+        tag = None
+        for label in reversed(domain.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            tag = node.get(self._TAG_KEY, tag)
+        return tag
+
+
 class LinkExtractor:
     """从文本中提取和分类URL"""
     
@@ -46,11 +160,18 @@ class LinkExtractor:
     
     # 通用视频域名/扩展名
     VIDEO_DOMAINS = ['video.twimg.com']
-    VIDEO_EXTENSIONS = ['.mp4', '.mov', '.webm', '.mkv']
+    # 元组形式可直接传给 str.endswith（单次C层调用）
+    VIDEO_EXTENSIONS = ('.mp4', '.mov', '.webm', '.mkv')
     
     # 媒体资源域名（图片、视频等）
     MEDIA_DOMAINS = ['twimg.com', 'pbs.twimg.com']
-    
+
+    # 跳过域名的URL前缀：推文里大多数链接是 t.co 短链，
+    # 一次C层 startswith 预筛掉多数URL，连 urlparse 都省了
+    _SKIP_PREFIXES = tuple(
+        f'{scheme}://{d}/' for d in SKIP_DOMAINS for scheme in ('https', 'http')
+    )
+
     @staticmethod
     def extract_urls(text: str) -> List[str]:
         """
@@ -62,25 +183,52 @@ class LinkExtractor:
         返回:
             提取到的URL列表
         """
-        if not text:
+        # 快速路径：无 http 的文本直接跳过正则扫描
+        if not text or 'http' not in text:
             return []
-        
-        # URL匹配正则表达式
-        pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(pattern, text)
-        
-        # 去重并保持顺序
-        seen = set()
-        unique_urls = []
-        for url in urls:
-            # 清理URL末尾可能的标点符号
-            url = url.rstrip('.,;:!?')
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
-        
-        return unique_urls
-    
+
+        # dict.fromkeys 在C层完成保序去重
+        return list(dict.fromkeys(_URL_RE.findall(text)))
+
+    # 批量拼接的分隔符：\x00 不会出现在URL字符类中，保证匹配不跨段
+    _BATCH_SEP = '\n\x00\n'
+
+    @classmethod
+    def extract_urls_batch(cls, texts: List[str]) -> List[List[str]]:
+        """
+        批量提取多段文本中的URL
+
+        把整批文本用哨兵分隔符拼接后只跑一次正则扫描，再按匹配偏移
+        二分回各自来源，摊薄逐条调用的正则引擎启动开销。
+        适用于一次性拿到整批post的调用方；流水线内逐条处理时用 extract_urls 即可。
+
+        参数:
+            texts: 要解析的文本列表
+
+        返回:
+            与输入等长的URL列表的列表（每段内保序去重）
+        """
+        if not texts:
+            return []
+
+        joined = cls._BATCH_SEP.join(t or '' for t in texts)
+        if 'http' not in joined:
+            return [[] for _ in texts]
+
+        # 各段文本在拼接串中的起始偏移
+        offsets = []
+        pos = 0
+        for t in texts:
+            offsets.append(pos)
+            pos += len(t or '') + len(cls._BATCH_SEP)
+
+        results = [{} for _ in texts]  # dict保序去重
+        for m in _URL_RE.finditer(joined):
+            idx = bisect.bisect_right(offsets, m.start()) - 1
+            results[idx][m.group()] = None
+
+        return [list(r) for r in results]
+
     @classmethod
     def categorize(cls, text: str) -> Tuple[List[str], List[str], List[str]]:
         """
@@ -98,31 +246,44 @@ class LinkExtractor:
         media_urls = []
         
         for url in urls:
-            parsed = urlparse(url)
+            # 多数路径（t.co等跳过域名）在解析前就短路掉
+            if url.startswith(cls._SKIP_PREFIXES):
+                continue
+
+            parsed = _cached_urlparse(url)
             domain = parsed.netloc.lower()
             path = parsed.path.lower()
-            
+
+            # 单次前缀树查询取代对4个域名列表的逐项子串扫描
+            tag = _DOMAIN_TRIE.match(domain.split(':', 1)[0]) if domain else None
+
             # 1. 视频链接 (YouTube 或 通用视频)
-            is_youtube = any(yt in domain for yt in cls.YOUTUBE_DOMAINS)
-            is_generic_video = (
-                any(v in domain for v in cls.VIDEO_DOMAINS) or 
-                any(path.endswith(ext) for ext in cls.VIDEO_EXTENSIONS)
-            )
-            
-            if is_youtube or is_generic_video:
+            if tag in ('youtube', 'video') or path.endswith(cls.VIDEO_EXTENSIONS):
                 video_links.append(url)
-            
+
             # 2. 其他媒体资源链接（图片等）
-            elif any(media in domain for media in cls.MEDIA_DOMAINS):
+            elif tag == 'media':
                 media_urls.append(url)
-            
+
             # 3. 博客/网页链接 (排除跳过的域名)
-            elif domain and not any(skip in domain for skip in cls.SKIP_DOMAINS):
+            elif domain and tag != 'skip':
                 blog_links.append(url)
-        
+
         return blog_links, video_links, media_urls
 
 
+# 域名分类前缀树：模块加载时从类常量构建一次，categorize 共享复用
+_DOMAIN_TRIE = _DomainTrie()
+for _tag, _domains in (
+    ('skip', LinkExtractor.SKIP_DOMAINS),
+    ('youtube', LinkExtractor.YOUTUBE_DOMAINS),
+    ('video', LinkExtractor.VIDEO_DOMAINS),
+    ('media', LinkExtractor.MEDIA_DOMAINS),
+):
+    for _domain in _domains:
+        _DOMAIN_TRIE.insert(_domain, _tag)
+
+
 class GenericVideoFetcher:
     """通用视频信息获取器 (支持YouTube, Twitter视频等)"""
     
@@ -133,14 +294,23 @@ class GenericVideoFetcher:
     
     def __init__(self, batch_timestamp: str = None):
         self.batch_timestamp = batch_timestamp
-    
+        # raw 输出基目录按批次固定，构造一次，热路径只拼 video_id
+        raw_dir_name = f"raw_{batch_timestamp}" if batch_timestamp else "raw"
+        self._raw_dir = os.path.join(_PROJECT_ROOT, 'data', raw_dir_name)
+
     def _is_likely_silent_video(self, url: str) -> bool:
         """检查URL是否可能是无声视频（如GIF转MP4）"""
         return any(pattern in url for pattern in self.SILENT_VIDEO_PATTERNS)
     
-    def _parse_video_info(self, url: str) -> Tuple[Optional[str], str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _parse_video_info(url: str, parsed=None) -> Tuple[Optional[str], str]:
         """
-        解析视频信息
+        解析视频信息（结果按URL缓存，同一URL跨批次只解析/哈希一次）
+        
+        参数:
+            url: 视频URL
+            parsed: 可选的已解析 ParseResult，避免重复解析
         
         返回:
             (video_id, video_url)
@@ -150,21 +320,23 @@ class GenericVideoFetcher:
         if not url:
             return None, ""
             
-        parsed = urlparse(url)
+        if parsed is None:
+            parsed = _cached_urlparse(url)
         domain = parsed.netloc.lower()
         
         # 1. 尝试解析 YouTube
-        youtube_id = self._extract_youtube_id(parsed, domain)
+        youtube_id = GenericVideoFetcher._extract_youtube_id(parsed, domain)
         if youtube_id:
             return youtube_id, f"https://www.youtube.com/watch?v={youtube_id}"
 
         # 2. 通用策略 (其他视频源)
-        return self._generate_generic_video_id(url, parsed), url
+        return GenericVideoFetcher._generate_generic_video_id(url, parsed), url
 
-    def _extract_youtube_id(self, parsed, domain) -> Optional[str]:
+    @staticmethod
+    def _extract_youtube_id(parsed, domain) -> Optional[str]:
         """辅助函数: 提取YouTube ID"""
         current_url = parsed.geturl()
-        if not any(d in domain for d in ['youtube.com', 'youtu.be']):
+        if domain not in _YT_DOMAINS and not domain.endswith(('.youtube.com', '.youtu.be')):
             logger.info(f"Skipping non-youtube page: {current_url}")
             return None
             
@@ -181,7 +353,7 @@ class GenericVideoFetcher:
             # youtube.com/watch?v=ID or /embed/ID
             if 'youtube.com' in domain:
                 if '/watch' in parsed.path:
-                    query = parse_qs(parsed.query)
+                    query = _cached_parse_qs(parsed.query)
                     return query.get('v', [None])[0]
                 if '/embed/' in parsed.path:
                     parts = parsed.path.split('/embed/')
@@ -191,19 +363,15 @@ class GenericVideoFetcher:
             pass
         return None
 
-    def _generate_generic_video_id(self, url: str, parsed, title: str = "") -> str:
+    @staticmethod
+    def _generate_generic_video_id(url: str, parsed, title: str = "") -> str:
         """辅助函数: 生成通用视频ID (基于标题、文件名或Hash)"""
-        import hashlib
-        
-        def get_hash(s):
-            return hashlib.md5(s.encode()).hexdigest()
-
         try:
             # 优先使用标题作为文件名基础
             safe_name = ""
             if title:
                 # 截取前50个字符并清理特殊字符
-                clean_title = "".join(c if c.isalnum() else '_' for c in title)[:50]
+                clean_title = _sanitize_name(title)[:50]
                 if clean_title:
                     safe_name = clean_title
 
@@ -211,123 +379,133 @@ class GenericVideoFetcher:
             if not safe_name:
                 filename = os.path.basename(parsed.path)
                 if filename and '.' in filename and len(filename) <= 80:
-                    safe_name = "".join(c if c.isalnum() else '_' for c in os.path.splitext(filename)[0])
+                    safe_name = _sanitize_name(os.path.splitext(filename)[0])
             
             # 如果还是没有有效的文件名基础，直接返回Hash
             if not safe_name:
-                return get_hash(url)[:12]
+                return _url_hash(url)[:12]
             
             # 组合: 安全文件名 + URL Hash前缀 (防止重名)
-            url_hash = get_hash(url)[:6]
+            url_hash = _url_hash(url)[:6]
             return f"{safe_name}_{url_hash}"
             
         except Exception:
             # 绝对兜底
-            return get_hash(url)[:12]
+            return _url_hash(url)[:12]
 
     
-    def fetch_transcript(self, video_id: str, video_url: str, context: str = "", optimize: bool = False) -> str:
+    def _transcribe(self, video_id: str, video_url: str):
         """
-        获取视频字幕，并保存 srt/txt 到 raw 目录
-        
-        使用 video_scribe 模块自动处理（下载+转录）
-        
-        参数:
-            video_id: 视频ID (也是目录名)
-            video_url: 视频可下载链接
-        
+        下载并转录视频，保存 srt/txt 到 raw 目录
+
         返回:
-            视频字幕文本
+            (ASRData, 输出目录) 元组，转录失败返回 (None, None)
         """
-        import os
-        import sys
-        
-        # 确保能导入 video_scribe
-        # video_scribe 在项目根目录， content_fetcher.py 在 native_scout/utils/ 目录
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir)) # Up 2 levels: utils -> native_scout -> root
-        if project_root not in sys.path:
-            sys.path.append(project_root)
-            
         try:
             # 构造输出目录: data/raw_{timestamp}/{video_id}/
-            raw_dir_name = f"raw_{self.batch_timestamp}" if self.batch_timestamp else "raw"
-            output_dir = os.path.join(project_root, 'data', raw_dir_name, video_id)
+            output_dir = os.path.join(self._raw_dir, video_id)
             os.makedirs(output_dir, exist_ok=True)
-            
+
             logger.info(f"开始转录视频 [ID: {video_id}] -> {output_dir}")
-            
+
             # 调用 video_scribe 处理
             # process_video 会自动保存 .srt, .txt, .json 到 output_dir
-            from video_scribe.core import process_video, optimize_subtitle
-            
+            process_video, _ = _load_video_scribe()
+
             asr_data = process_video(
                 video_url_or_path=video_url,
                 output_dir=output_dir,
                 device="cuda", # 默认使用CUDA，如果失败 video_scribe 可能会报错，需确保环境
                 language=None  # 自动检测
             )
-            
-            # --- LLM 字幕优化 ---
-            # youtube 自动生成的字幕质量很差，会导致优化后的字幕文件和优化前字幕变化较大，导致优化失败（差异判别过大），故先把优化关掉
-            final_data = asr_data  # 默认为原始数据
-            if optimize:
-                try:
-                    logger.info(f"开始优化字幕 [ID: {video_id}]...")
-                    api_key = config.get('llm', 'api_key')
-                    base_url = config.get('llm', 'base_url')
-                    model = config.get('llm', 'opt_model', fallback='gpt-3.5-turbo')
-                    
-                    if context:
-                        custom_prompt = f"Context: {context}"
-                    logger.info(f"优化字幕上下文信息：{custom_prompt}")
-
-                    optimized_data = optimize_subtitle(
-                        subtitle_data=asr_data,
-                        model=model,
-                        api_key=api_key,
-                        base_url=base_url,
-                        custom_prompt=custom_prompt
-                    )
-                    
-                    save_base = os.path.join(output_dir, f"{video_id}_optimized")
-                    optimized_data.save(save_base + ".srt")
-                    optimized_data.save(save_base + ".txt")
-                    
-                    final_data = optimized_data
-                    
-                except Exception as opt_e:
-                    logger.warning(f"字幕优化失败，回退到原始字幕 [ID: {video_id}]: {opt_e}")
-                    # 即使优化失败，也继续返回原始字幕
-            
-            # 返回最终文本（优化后或原始）
-            return final_data.to_txt()
-            
+            return asr_data, output_dir
+
         except Exception as e:
             error_msg = str(e)
-            
+
             # 特殊处理：无音频编解码器（静音视频/GIF）
             if 'unable to obtain file audio codec' in error_msg:
                 logger.info(f"跳过静音视频（无音轨）[ID: {video_id}]")
-                return ''
-            
+                return None, None
+
             logger.error(f"视频转录流程严重失败 [ID: {video_id}]: {e}")
             import traceback
             traceback.print_exc()
+            return None, None
+
+    def optimize_transcript(self, asr_data, video_id: str, output_dir: str, context: str = ""):
+        """
+        LLM 字幕优化（失败时回退原始字幕）
+
+        与转录拆开，便于调用方先批量转录、再把多条字幕的优化请求
+        一次性并发发出，而不是每个视频串行等一轮 LLM 往返
+        """
+        # youtube 自动生成的字幕质量很差，会导致优化后的字幕文件和优化前字幕变化较大，导致优化失败（差异判别过大），故先把优化关掉
+        try:
+            logger.info(f"开始优化字幕 [ID: {video_id}]...")
+            api_key = _LLM_CONF.get('api_key')
+            base_url = _LLM_CONF.get('base_url')
+            model = _LLM_CONF.get('opt_model', 'gpt-3.5-turbo')
+
+            custom_prompt = f"Context: {context}" if context else ""
+            logger.info(f"优化字幕上下文信息：{custom_prompt}")
+
+            _, optimize_subtitle = _load_video_scribe()
+            optimized_data = optimize_subtitle(
+                subtitle_data=asr_data,
+                model=model,
+                api_key=api_key,
+                base_url=base_url,
+                custom_prompt=custom_prompt
+            )
+
+            save_base = os.path.join(output_dir, f"{video_id}_optimized")
+            optimized_data.save(save_base + ".srt")
+            optimized_data.save(save_base + ".txt")
+
+            return optimized_data
+
+        except Exception as opt_e:
+            logger.warning(f"字幕优化失败，回退到原始字幕 [ID: {video_id}]: {opt_e}")
+            # 即使优化失败，也继续返回原始字幕
+            return asr_data
+
+    def fetch_transcript(self, video_id: str, video_url: str, context: str = "", optimize: bool = False) -> str:
+        """
+        获取视频字幕，并保存 srt/txt 到 raw 目录
+
+        使用 video_scribe 模块自动处理（下载+转录）
+
+        参数:
+            video_id: 视频ID (也是目录名)
+            video_url: 视频可下载链接
+
+        返回:
+            视频字幕文本
+        """
+        asr_data, output_dir = self._transcribe(video_id, video_url)
+        if asr_data is None:
             return ''
-    
-    def fetch(self, url: str, context: str = "", title: str = "", optimize: bool = False) -> Optional[EmbeddedContent]:
+
+        # --- LLM 字幕优化 ---
+        if optimize:
+            asr_data = self.optimize_transcript(asr_data, video_id, output_dir, context=context)
+
+        # 返回最终文本（优化后或原始）
+        return asr_data.to_txt()
+
+    def transcribe(self, url: str, title: str = "") -> Optional[Tuple[EmbeddedContent, object, str]]:
         """
-        获取视频的完整信息
-        
+        解析并转录视频，不做 LLM 优化（优化由调用方批量触发）
+
         参数:
             url: 视频URL
-            context: 上下文信息
             title: 视频标题 (用于生成更有意义的文件名)
         返回:
-            EmbeddedContent对象，如果无法提取则返回None
+            (EmbeddedContent, ASRData, 输出目录) 元组，无法提取则返回None；
+            转录失败时 ASRData/输出目录 为 None，内容为空字幕
         """
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         domain = parsed.netloc.lower()
 
         # 1. 尝试解析 YouTube ID
@@ -343,21 +521,46 @@ class GenericVideoFetcher:
         if not video_id:
             logger.info(f"无法解析视频信息: {_shorten_url(url)}")
             return None
-        
+
         # 预检查：跳过已知的无声视频
         if self._is_likely_silent_video(url):
             logger.info(f"跳过静音视频（URL模式匹配）: {_shorten_url(url)}")
             return None
-        
-        transcript = self.fetch_transcript(video_id, video_url, context=context, optimize=optimize)
-        
-        return EmbeddedContent(
+
+        asr_data, output_dir = self._transcribe(video_id, video_url)
+
+        item = EmbeddedContent(
             url=url,
             content_type='subtitle',
             title=title,
-            content=transcript,
+            content=asr_data.to_txt() if asr_data is not None else '',
             metadata={'video_id': video_id, 'video_url': video_url}
         )
+        return item, asr_data, output_dir
+
+    def fetch(self, url: str, context: str = "", title: str = "", optimize: bool = False) -> Optional[EmbeddedContent]:
+        """
+        获取视频的完整信息
+
+        参数:
+            url: 视频URL
+            context: 上下文信息
+            title: 视频标题 (用于生成更有意义的文件名)
+        返回:
+            EmbeddedContent对象，如果无法提取则返回None
+        """
+        prepared = self.transcribe(url, title=title)
+        if prepared is None:
+            return None
+
+        item, asr_data, output_dir = prepared
+        if optimize and asr_data is not None:
+            optimized = self.optimize_transcript(
+                asr_data, item.metadata['video_id'], output_dir, context=context
+            )
+            item.content = optimized.to_txt()
+
+        return item
 
 
 class BlogFetcher:
@@ -379,25 +582,26 @@ class BlogFetcher:
             EmbeddedContent对象，如果爬取失败则返回None
         """
         try:
-            # 延迟导入，避免不使用时加载 Selenium
-            from utils.web_crawler import fetch_web_content
-            
-            result = fetch_web_content(url)
-            
+            # 延迟导入，避免不使用时加载 Selenium（首次导入后缓存）
+            fetch_web_content = _load_web_crawler()
+
+            # 截断下推到提取阶段：多取1个字符用于判断是否真的超长
+            result = fetch_web_content(url, max_chars=self.MAX_CONTENT_LENGTH + 1)
+
             if result:
                 content = result.get('content', '')
-                
+
                 # 截断过长内容
                 if len(content) > self.MAX_CONTENT_LENGTH:
                     content = content[:self.MAX_CONTENT_LENGTH] + '...'
-                
+
                 return EmbeddedContent(
                     url=url,
                     content_type='blog',
                     title=result.get('title', ''),
                     content=content,
                     metadata={
-                        'original_length': len(result.get('content', ''))
+                        'original_length': len(content)
                     }
                 )
             
@@ -409,10 +613,17 @@ class BlogFetcher:
             return None
 
 
+# 模块级共享线程池：跨post复用，避免每次爬取都重建线程
+# Selenium 较重，博客爬取并发上限单独压低；字幕优化是纯LLM往返，单独成池
+_VIDEO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="VideoFetcher")
+_BLOG_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="BlogFetcher")
+_OPT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="SubtitleOpt")
+
+
 class ContentFetcher:
     """
     内容爬取统一入口（门面模式）
-    
+
     提供简洁的API，隐藏内部的链接提取和分类爬取逻辑
     """
     
@@ -436,34 +647,77 @@ class ContentFetcher:
         """
         if not text:
             return [], []
-        
+
         # 提取并分类URL
         blog_links, video_links, media_urls = LinkExtractor.categorize(text)
         results = []
-        
-        # 处理视频链接 (YouTube + Generic)
-        for url in video_links:
+
+        # 并发提交视频转录 + 博客爬取任务（各自独立，串行只是白等I/O）
+        # 视频只做转录，LLM优化攒到下面批量并发发出
+        # 出错日志所需的url由闭包捕获，Future列表即可，无需 Future→url 的dict映射
+        def _transcribe_one(url):
             try:
-                logger.info(f"正在获取视频内容: {_shorten_url(url)}")
-                content = self.video_fetcher.fetch(url, title=title, context=text, optimize=optimize_video)
-                if content:
-                    results.append(content)
+                return self.video_fetcher.transcribe(url, title=title)
             except Exception as e:
                 logger.info(f"视频内容获取失败 [{_shorten_url(url)}]: {e}")
-        
-        # 处理博客链接
-        for url in blog_links:
+                return None
+
+        def _fetch_blog_one(url):
             try:
-                logger.info(f"正在获取博客内容: {_shorten_url(url)}")
-                content = self.blog_fetcher.fetch(url)
-                if content:
-                    results.append(content)
+                return self.blog_fetcher.fetch(url)
             except Exception as e:
                 logger.info(f"博客内容获取失败 [{_shorten_url(url)}]: {e}")
-        
+                return None
+
+        video_futures = []
+        for url in video_links:
+            logger.info(f"正在获取视频内容: {_shorten_url(url)}")
+            video_futures.append(_VIDEO_POOL.submit(_transcribe_one, url))
+
+        blog_futures = []
+        for url in blog_links:
+            logger.info(f"正在获取博客内容: {_shorten_url(url)}")
+            blog_futures.append(_BLOG_POOL.submit(_fetch_blog_one, url))
+
+        # 收集转录结果，记下待优化的字幕
+        pending_optimize = []  # [(EmbeddedContent, ASRData, 输出目录)]
+        for future in as_completed(video_futures):
+            prepared = future.result()
+            if prepared is None:
+                continue
+            item, asr_data, output_dir = prepared
+            results.append(item)
+            if optimize_video and asr_data is not None:
+                pending_optimize.append((item, asr_data, output_dir))
+
+        # 批量字幕优化：所有视频的LLM往返一波并发，而不是逐视频串行等待
+        # 任务自己回填 item.content，Future 不再需要映射回 item
+        if pending_optimize:
+            def _optimize_one(item, asr_data, output_dir):
+                try:
+                    # optimize_transcript 内部已兜底：失败返回原始字幕
+                    optimized = self.video_fetcher.optimize_transcript(
+                        asr_data, item.metadata['video_id'], output_dir, text
+                    )
+                    item.content = optimized.to_txt()
+                except Exception as e:
+                    logger.info(f"字幕优化任务异常 [{item.metadata['video_id']}]: {e}")
+
+            opt_futures = [
+                _OPT_POOL.submit(_optimize_one, item, asr_data, output_dir)
+                for item, asr_data, output_dir in pending_optimize
+            ]
+            for future in as_completed(opt_futures):
+                future.result()
+
+        for future in as_completed(blog_futures):
+            content = future.result()
+            if content:
+                results.append(content)
+
         # 合并所有外部资源链接（博客、YouTube、媒体）
         all_urls = blog_links + video_links + media_urls
-        
+
         return results, all_urls
 
     def fetch_video(self, url: str, context: str = "", title: str = "", optimize: bool = False) -> Optional[EmbeddedContent]:
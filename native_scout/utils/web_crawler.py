@@ -8,7 +8,9 @@ web_crawler.py - Web 页面抓取工具
 
 依赖：selenium, beautifulsoup4, openai, webdriver-manager
 """
+import atexit
 import base64
+import threading
 from datetime import datetime
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -24,6 +26,85 @@ from common import setup_logger
 
 logger = setup_logger("web_crawler")
 
+# ================= WebDriver 池 =================
+# Chromedriver 启动需要数秒、占用约200MB内存；按线程复用热会话，
+# 并发驱动数由调用方线程池上限控制（BlogFetcher 为 3）
+_driver_local = threading.local()
+_all_drivers = []
+_all_drivers_lock = threading.Lock()
+
+
+def _build_chrome_options():
+    """构造无头浏览器配置（抓取正文不加载图片，减少页面流量）"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+    # 伪装 User-Agent
+    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+    # 规避检测
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    return chrome_options
+
+
+def get_driver():
+    """返回当前线程绑定的 WebDriver（首次调用创建，之后复用）"""
+    driver = getattr(_driver_local, "driver", None)
+    if driver is not None:
+        return driver
+
+    service = Service(ChromeDriverManager().install())
+    driver = webdriver.Chrome(service=service, options=_build_chrome_options())
+
+    # 进一步规避：移除 navigator.webdriver 标记
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        "source": """
+        Object.defineProperty(navigator, 'webdriver', {
+          get: () => undefined
+        })
+        """
+    })
+
+    _driver_local.driver = driver
+    with _all_drivers_lock:
+        _all_drivers.append(driver)
+    return driver
+
+
+def _discard_thread_driver():
+    """丢弃当前线程的驱动（会话异常后调用，下次重建）"""
+    driver = getattr(_driver_local, "driver", None)
+    if driver is None:
+        return
+    _driver_local.driver = None
+    with _all_drivers_lock:
+        if driver in _all_drivers:
+            _all_drivers.remove(driver)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def _quit_all_drivers():
+    with _all_drivers_lock:
+        drivers, _all_drivers[:] = _all_drivers[:], []
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_quit_all_drivers)
+
 # ================= 配置区域 =================
 # 设置普通 Web URL 抓取源
 # 适用于没有 RSS 的单页面，如具体的一篇博文或静态页面
@@ -94,47 +175,42 @@ def _clean_text_content(text):
         
     return '\n'.join(cleaned_lines)
 
-def fetch_web_content(url):
+def _collect_text(element, max_chars=None):
+    """
+    流式拼接元素文本，等价于 get_text(separator='\\n', strip=True)
+
+    超过 max_chars 即停止遍历，避免超大页面把全部正文物化成一个巨型字符串
+    """
+    parts = []
+    total = 0
+    for chunk in element.stripped_strings:
+        parts.append(chunk)
+        total += len(chunk) + 1
+        if max_chars is not None and total > max_chars:
+            break
+    return '\n'.join(parts)
+
+
+def fetch_web_content(url, driver=None, max_chars=None):
     """
     [Optimized] 抓取普通网页内容
-    
+
     改进点：
     1. 智能等待 (WebDriverWait)
     2. 模拟滚动 (Lazy Load支持)
     3. 内容清洗 (移除干扰标签)
     4. 反爬虫规避优化
+    5. WebDriver 按线程复用（见 get_driver）
+
+    参数:
+        max_chars: 正文字符数上限，提取阶段到量即停（None 表示不限制）
     """
     logger.info(f"正在抓取网页(Selenium Optimized): {url} ...")
-    driver = None
     try:
-        # 配置无头浏览器
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        # 伪装 User-Agent
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        # 规避检测
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        # 复用线程绑定的热驱动，省掉每次数秒的浏览器启动
+        if driver is None:
+            driver = get_driver()
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # 进一步规避：移除 navigator.webdriver 标记
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-            Object.defineProperty(navigator, 'webdriver', {
-              get: () => undefined
-            })
-            """
-        })
-        
         driver.get(url)
         
         # 1. 智能等待：等待 body 可见，最长 15秒
@@ -201,18 +277,25 @@ def fetch_web_content(url):
                 break
                 
         if target_element:
-            content_text = target_element.get_text(separator='\n', strip=True)
+            content_text = _collect_text(target_element, max_chars=max_chars)
         else:
             # 策略B: 兜底 - 提取所有P标签，但进行密度过滤
             logger.info("-> 使用段落密度回退策略")
-            paragraphs = soup.find_all('p')
-            # 过滤掉过短的导航性文字 (例如少于 5 个字)
-            valid_paragraphs = [p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 5]
+            valid_paragraphs = []
+            total = 0
+            for p in soup.find_all('p'):
+                para = p.get_text().strip()
+                # 过滤掉过短的导航性文字 (例如少于 5 个字)
+                if len(para) > 5:
+                    valid_paragraphs.append(para)
+                    total += len(para) + 1
+                    if max_chars is not None and total > max_chars:
+                        break
             content_text = "\n".join(valid_paragraphs)
-            
+
             # 策略C: 如果还是没东西，Last Resort
         if len(content_text) < 50 and soup.body:
-                content_text = soup.body.get_text(separator='\n', strip=True)
+                content_text = _collect_text(soup.body, max_chars=max_chars)
 
         logger.info(f"-> 原始内容长度: {len(content_text)} 字符")
         
@@ -220,6 +303,10 @@ def fetch_web_content(url):
         content_text = _clean_text_content(content_text)
         logger.info(f"-> 清洗后内容长度: {len(content_text)} 字符")
 
+        # 流式提取按文本块断流，最后一块可能越界，这里收口到精确上限
+        if max_chars is not None and len(content_text) > max_chars:
+            content_text = content_text[:max_chars]
+
         pub_date = datetime.now().strftime("%Y-%m-%d")
         
         return {
@@ -230,10 +317,9 @@ def fetch_web_content(url):
         }
     except Exception as e:
         logger.info(f"网页抓取失败: {e}")
+        # 会话可能已损坏，丢弃后下次调用重建
+        _discard_thread_driver()
         return None
-    finally:
-        if driver:
-            driver.quit()
 
 
 def _prepare_page_for_capture(url):
@@ -0,0 +1,53 @@
+import os
+import sys
+import unittest
+
+# Ensure project modules are importable.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CRAWLER_DIR = os.path.join(ROOT_DIR, "native_scout")
+sys.path.insert(0, CRAWLER_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+import feedparser
+
+from utils.feedparse_fast import parse_bytes
+
+# YouTube-shaped Atom feed: no atom:summary/atom:content, the text lives
+# only in media:group/media:description.
+YOUTUBE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:media="http://search.yahoo.com/mrss/">
+  <title>Example Channel</title>
+  <entry>
+    <id>yt:video:abc123</id>
+    <title>Example video</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=abc123"/>
+    <published>2026-01-02T03:04:05+00:00</published>
+    <media:group>
+      <media:title>Example video</media:title>
+      <media:description>This is the video description text.</media:description>
+    </media:group>
+  </entry>
+</feed>
+"""
+
+
+class TestFeedparseFast(unittest.TestCase):
+    def test_youtube_media_description_matches_feedparser(self):
+        entries = parse_bytes(YOUTUBE_FEED)
+        self.assertIsNotNone(entries)
+        self.assertEqual(len(entries), 1)
+        entry = entries[0]
+
+        reference = feedparser.parse(YOUTUBE_FEED).entries[0]
+        self.assertEqual(
+            entry.get("description"), reference.get("description", "")
+        )
+        self.assertEqual(
+            entry.get("description"), "This is the video description text."
+        )
+        self.assertEqual(entry.title, reference.title)
+        self.assertEqual(entry.link, reference.link)
+
+
+if __name__ == "__main__":
+    unittest.main()
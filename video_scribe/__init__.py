@@ -1,11 +1,34 @@
-from .core import process_video, optimize_subtitle
-from .config import TranscribeConfig
-from .data import ASRData, ASRDataSeg
+# Lazy attribute access (PEP 562): importing video_scribe no longer pulls
+# in core's dependency chain (yt_dlp, requests/tqdm, the ASR stack) until
+# the corresponding symbol is actually used. Callers that only want
+# ASRData or TranscribeConfig pay for just those modules.
+_LAZY_IMPORTS = {
+    "process_video": ".core",
+    "optimize_subtitle": ".core",
+    "TranscribeConfig": ".config",
+    "ASRData": ".data",
+    "ASRDataSeg": ".data",
+}
 
 __all__ = [
-    "process_video", 
-    "optimize_subtitle", 
+    "process_video",
+    "optimize_subtitle",
     "TranscribeConfig",
     "ASRData",
     "ASRDataSeg"
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
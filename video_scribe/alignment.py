@@ -1,13 +1,21 @@
 import difflib
 
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:
+    Indel = None
+
+
 class SubtitleAligner:
     """
     Subtitle text aligner for aligning two text sequences.
-    Ported from app.core.split.alignment.py
-    """
 
-    def __init__(self):
-        self.line_numbers = [0, 0]
+    Alignment is driven by diff opcodes over whole lines instead of the
+    old pure-Python walk of difflib.ndiff's 4-line windows, which also
+    ran a character-level diff per changed line pair. With rapidfuzz
+    installed the opcodes come from its C Indel implementation; otherwise
+    difflib.SequenceMatcher (no per-line refinement) is used.
+    """
 
     def align_texts(self, source_text, target_text):
         """
@@ -17,150 +25,40 @@ class SubtitleAligner:
             source_text (list): List of lines from the source text.
             target_text (list): List of lines from the target text.
 
-        Returns:
-            tuple: Two lists containing aligned lines from source and target texts.
-        """
-        diff_iterator = difflib.ndiff(source_text, target_text)
-        return self._pair_lines(diff_iterator)
-
-    def _pair_lines(self, diff_iterator):
-        """
-        Pair lines from the diff iterator.
-
-        Args:
-            diff_iterator: Iterator from difflib.ndiff()
-
         Returns:
             tuple: Two lists containing aligned lines from source and target texts.
         """
         source_lines = []
         target_lines = []
-        flag = 0
 
-        for source_line, target_line, _ in self._line_iterator(diff_iterator):
-            if source_line is not None:
-                if source_line[1] == "\n":
-                    flag += 1
-                    continue
-                source_lines.append(source_line[1])
-            if target_line is not None:
-                if flag > 0:
-                    flag -= 1
-                    continue
-                target_lines.append(target_line[1])
-
-        for i in range(1, len(target_lines)):
-            if target_lines[i] == "\n":
-                target_lines[i] = target_lines[i - 1]
+        # Every source line gets a slot: matched target lines pair up,
+        # unmatched source lines repeat the previous target line, and
+        # target-only insertions are dropped (same behaviour the ndiff
+        # walker converged to).
+        for tag, i1, i2, j1, j2 in self._opcodes(source_text, target_text):
+            if tag == "equal":
+                source_lines.extend(source_text[i1:i2])
+                target_lines.extend(target_text[j1:j2])
+            elif tag == "replace":
+                paired = min(i2 - i1, j2 - j1)
+                source_lines.extend(source_text[i1:i1 + paired])
+                target_lines.extend(target_text[j1:j1 + paired])
+                for index in range(i1 + paired, i2):
+                    source_lines.append(source_text[index])
+                    target_lines.append(target_lines[-1] if target_lines else "")
+            elif tag == "delete":
+                for index in range(i1, i2):
+                    source_lines.append(source_text[index])
+                    target_lines.append(target_lines[-1] if target_lines else "")
 
         return source_lines, target_lines
 
-    def _line_iterator(self, diff_iterator):
-        """
-        Iterate through diff lines and yield paired lines.
-
-        Args:
-            diff_iterator: Iterator from difflib.ndiff()
-
-        Yields:
-            tuple: (source_line, target_line, has_diff)
-        """
-        lines = []
-        blank_lines_pending = 0
-        blank_lines_to_yield = 0
-
-        while True:
-            while len(lines) < 4:
-                lines.append(next(diff_iterator, "X"))
-
-            diff_type = "".join([line[0] for line in lines])
-
-            if diff_type.startswith("X"):
-                blank_lines_to_yield = blank_lines_pending
-            elif diff_type.startswith("-?+?"):
-                yield (
-                    self._format_line(lines, "?", 0),
-                    self._format_line(lines, "?", 1),
-                    True,
-                )
-                continue
-            elif diff_type.startswith("--++"):
-                blank_lines_pending -= 1
-                yield self._format_line(lines, "-", 0), None, True
-                continue
-            elif diff_type.startswith(("--?+", "--+", "- ")):
-                source_line, target_line = self._format_line(lines, "-", 0), None
-                blank_lines_to_yield, blank_lines_pending = blank_lines_pending - 1, 0
-            elif diff_type.startswith("-+?"):
-                yield (
-                    self._format_line(lines, None, 0),
-                    self._format_line(lines, "?", 1),
-                    True,
-                )
-                continue
-            elif diff_type.startswith("-?+"):
-                yield (
-                    self._format_line(lines, "?", 0),
-                    self._format_line(lines, None, 1),
-                    True,
-                )
-                continue
-            elif diff_type.startswith("-"):
-                blank_lines_pending -= 1
-                yield self._format_line(lines, "-", 0), None, True
-                continue
-            elif diff_type.startswith("+--"):
-                blank_lines_pending += 1
-                yield None, self._format_line(lines, "+", 1), True
-                continue
-            elif diff_type.startswith(("+ ", "+-")):
-                source_line, target_line = None, self._format_line(lines, "+", 1)
-                blank_lines_to_yield, blank_lines_pending = blank_lines_pending + 1, 0
-            elif diff_type.startswith("+"):
-                blank_lines_pending += 1
-                yield None, self._format_line(lines, "+", 1), True
-                continue
-            elif diff_type.startswith(" "):
-                yield (
-                    self._format_line(lines[:], None, 0),
-                    self._format_line(lines, None, 1),
-                    False,
-                )
-                continue
-
-            while blank_lines_to_yield < 0:
-                blank_lines_to_yield += 1
-                yield None, ("", "\n"), True
-            while blank_lines_to_yield > 0:
-                blank_lines_to_yield -= 1
-                yield ("", "\n"), None, True
-
-            if diff_type.startswith("X"):
-                return
-            else:
-                yield source_line, target_line, True
-
-    def _format_line(self, lines, format_key, side):
-        """
-        Format a line with the appropriate markup.
-
-        Args:
-            lines (list): List of lines to process.
-            format_key (str): Formatting key ('?', '-', '+', or None).
-            side (int): 0 for source, 1 for target.
-
-        Returns:
-            tuple: (line_number, formatted_text)
-        """
-        self.line_numbers[side] += 1
-        if format_key is None:
-            return self.line_numbers[side], lines.pop(0)[2:]
-        if format_key == "?":
-            text = lines.pop(0)
-            lines.pop(0)  # Skip markers line
-            text = text[2:]
-        else:
-            text = lines.pop(0)[2:]
-            if not text:
-                text = ""
-        return self.line_numbers[side], text
+    def _opcodes(self, source_text, target_text):
+        """Return (tag, i1, i2, j1, j2) opcodes for the two line lists."""
+        if Indel is not None:
+            return [
+                (op.tag, op.src_start, op.src_end, op.dest_start, op.dest_end)
+                for op in Indel.opcodes(source_text, target_text)
+            ]
+        matcher = difflib.SequenceMatcher(None, source_text, target_text, autojunk=False)
+        return matcher.get_opcodes()
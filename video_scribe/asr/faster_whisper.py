@@ -1,37 +1,53 @@
+import logging
 import os
 import re
 import shutil
 import subprocess
 import tempfile
+from collections import deque
 from pathlib import Path
 from typing import Callable, Optional, List
 
 from ..config import TranscribeConfig
 from ..data import ASRData
 from .base import BaseASR
-from ..subprocess_helper import StreamReader
 from ..utils import setup_logger
 
 logger = setup_logger("faster_whisper")
 
+# Progress lines look like "... 42% ..."; matched on raw bytes so the
+# stream never needs decoding just to track progress.
+_PROGRESS_RE = re.compile(rb"(\d+)%")
+
+# Report progress in at-least-5% steps (plus completion) so a long video
+# triggers ~20 callbacks instead of 100+, and reuse the percent strings
+# rather than re-formatting them in the read loop.
+_PROGRESS_STEP = 5
+_PCT = tuple(f"{i}%" for i in range(101))
+
 class FasterWhisperASR(BaseASR):
     def __init__(self, audio_input: str, config: TranscribeConfig):
         super().__init__(audio_input)
         self.config = config
         self.process = None
-
-    def _build_command(self, audio_input: str) -> List[str]:
-        model_arg = self.config.model_path
+        # Resolved once per instance: the model path never changes, so
+        # batch runs don't re-stat it on every _build_command call.
+        self._resolved_model, self._model_dir = self._resolve_model(config.model_path)
+
+    @staticmethod
+    def _resolve_model(model_path):
+        """Split an absolute model path into (-m name, --model_dir) args.
+
+        Example:
+          Input: "D:\\models\\faster-whisper-large-v3"
+          Result:
+            model_arg = "large-v3" (passed to -m)
+            model_dir_arg = "D:\\models" (passed to --model_dir)
+          This is required because faster-whisper-xxl automatically prepends
+          'faster-whisper-' to the model name and looks inside --model_dir.
+        """
+        model_arg = model_path
         model_dir_arg = None
-        
-        # Handle absolute model path by splitting into name and directory
-        # Example: 
-        #   Input: "D:\models\faster-whisper-large-v3"
-        #   Result: 
-        #     model_arg = "large-v3" (passed to -m)
-        #     model_dir_arg = "D:\models" (passed to --model_dir)
-        #   This is required because faster-whisper-xxl automatically prepends 'faster-whisper-' 
-        #   to the model name and looks inside --model_dir.
         if model_arg and os.path.isabs(str(model_arg)):
             path_obj = Path(model_arg)
             if path_obj.exists():
@@ -40,9 +56,13 @@ class FasterWhisperASR(BaseASR):
                     model_arg = folder_name.replace("faster-whisper-", "", 1)
                 else:
                     model_arg = folder_name
-                
-                cmd_model_dir = str(path_obj.parent)
-                model_dir_arg = cmd_model_dir
+
+                model_dir_arg = str(path_obj.parent)
+        return model_arg, model_dir_arg
+
+    def _build_command(self, audio_input: str) -> List[str]:
+        model_arg = self._resolved_model
+        model_dir_arg = self._model_dir
 
         cmd = [
             str(self.config.faster_whisper_program),
@@ -74,6 +94,26 @@ class FasterWhisperASR(BaseASR):
         cmd.extend(["--beep_off"])
         return cmd
 
+    def _materialize_input(self, wav_path: Path):
+        """Make the audio available at wav_path without copying if possible.
+
+        The tempdir only exists so whisper's ``-o source`` drops the .srt
+        next to the audio; a hardlink (or symlink) gives it that layout
+        for free instead of rewriting gigabytes. Falls back to copy2 when
+        linking is unsupported (cross-device, FAT, missing privilege).
+        """
+        try:
+            os.link(self.audio_input, wav_path)
+            return
+        except OSError:
+            pass
+        try:
+            os.symlink(os.path.abspath(self.audio_input), wav_path)
+            return
+        except OSError:
+            pass
+        shutil.copy2(self.audio_input, wav_path)
+
     def run(self, callback: Optional[Callable[[int, str], None]] = None) -> ASRData:
         if not callback:
             def callback(p, m): pass
@@ -81,10 +121,9 @@ class FasterWhisperASR(BaseASR):
         with tempfile.TemporaryDirectory() as temp_path:
             # We assume input is a file path
             temp_dir = Path(temp_path)
-            # Ensure we work with a wav file if possible, or just pass the path
-            # The original code copys to temp, let's do that for safety
+            # Link (or copy as a last resort) the input into the tempdir
             wav_path = temp_dir / "audio.wav"
-            shutil.copy2(self.audio_input, wav_path)
+            self._materialize_input(wav_path)
             
             # Output will be audio.srt in the same dir (since -o source) 
             # OR we specify output dir via command but if we use temp dir we want to capture it there.
@@ -94,46 +133,66 @@ class FasterWhisperASR(BaseASR):
             cmd = self._build_command(str(wav_path))
             logger.info(f"Running command: {' '.join(cmd)}")
 
+            # Binary, unbuffered pipe read directly in this thread: one
+            # blocking os.read per burst of output instead of a reader
+            # thread plus a 10Hz poll/queue wakeup loop per line.
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                errors="ignore",
+                bufsize=0,
                 creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
             )
 
-            reader = StreamReader(self.process)
-            reader.start_reading()
-
-            is_finish = False
             last_progress = 0
+            stdout_fd = self.process.stdout.fileno()
+            buffer = bytearray()
+            # Checked once: skips LogRecord allocation + handler locking
+            # per output line when INFO is disabled. The tail deque keeps
+            # the recent output either way so failures stay diagnosable.
+            log_info = logger.isEnabledFor(logging.INFO)
+            tail = deque(maxlen=200)
+
+            def handle_line(raw_line):
+                nonlocal last_progress
+                line = raw_line.strip()
+                if not line:
+                    return
+                if match := _PROGRESS_RE.search(line):
+                    progress = min(int(match.group(1)), 100)
+                    if (progress - last_progress >= _PROGRESS_STEP
+                            or (progress == 100 and last_progress < 100)):
+                        last_progress = progress
+                        callback(progress, _PCT[progress])
+                decoded = line.decode("utf-8", errors="ignore")
+                tail.append(decoded)
+                if log_info:
+                    logger.info(decoded)
 
             while True:
-                if self.process.poll() is not None:
-                     # Process finished
-                    for _, line in reader.get_remaining_output():
-                        line = line.strip()
-                        if line: logger.info(line)
+                chunk = os.read(stdout_fd, 1 << 16)
+                if not chunk:
                     break
+                buffer += chunk
+                if b"\n" not in chunk and b"\r" not in chunk:
+                    continue
+                # whisper rewrites progress lines with bare \r; treat it
+                # as a line break like the old universal-newline reader.
+                lines = buffer.replace(b"\r", b"\n").split(b"\n")
+                buffer = bytearray(lines.pop())
+                for raw_line in lines:
+                    handle_line(raw_line)
+
+            handle_line(bytes(buffer))
+            self.process.wait()
+
 
-                output = reader.get_output(timeout=0.1)
-                if output:
-                    _, line = output
-                    line = line.strip()
-                    if line:
-                        if match := re.search(r"(\d+)%", line):
-                            progress = int(match.group(1))
-                            if progress == 100: is_finish = True
-                            if progress > last_progress:
-                                last_progress = progress
-                                callback(progress, f"{progress}%")
-                            
-                        logger.info(line)
-            
             if not output_srt_path.exists():
+                if tail:
+                    logger.error("Last whisper output:\n%s", "\n".join(tail))
                 raise RuntimeError("ASR failed to generate subtitle file.")
 
-            srt_content = output_srt_path.read_text(encoding="utf-8")
+            # One bulk binary read + decode; skips the text layer's
+            # incremental decoder and newline translation.
+            srt_content = output_srt_path.read_bytes().decode("utf-8")
             return ASRData.from_srt(srt_content)
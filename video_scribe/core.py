@@ -3,63 +3,10 @@ from typing import Optional, Union
 
 from .data import ASRData
 from .config import TranscribeConfig, DEFAULT_MODEL_NAME
-from .downloader import download_audio
-from .asr.factory import create_asr
 from .utils import setup_logger
-from .resource_manager import ensure_executable, ensure_model
-import glob
-import json
 
 logger = setup_logger("video-scribe")
 
-def try_download_youtube_subtitles(url: str, output_dir: str, lang: str = "en") -> Optional[str]:
-    """
-    Try to download YouTube subtitles using yt-dlp.
-    Returns path to the downloaded subtitle file (vtt) if successful, else None.
-    """
-    # Guard: Only attempt for YouTube URLs
-    if not any(domain in url for domain in ['youtube.com', 'youtu.be']):
-        return None
-        
-    import subprocess
-    
-    # Clean output dir patterns first to avoid confusion with old files
-    base_pattern = os.path.join(output_dir, "ytsub_temp.*")
-    for f in glob.glob(base_pattern):
-        try: os.remove(f)
-        except: pass
-        
-    output_template = os.path.join(output_dir, "ytsub_temp.%(ext)s")
-    
-    # Try manual subs first, then auto-subs
-    # Try manual subs first, then auto-subs
-    # We use 'srt' format as it's cleaner via yt-dlp conversion
-    cmd = [
-        "yt-dlp",
-        "--skip-download",   # Don't download video
-        "--write-subs",      # Try manual subs
-        "--write-auto-subs", # Fallback to auto subs
-        "--sub-lang", lang,  # Language code
-        "--sub-format", "srt", # Enforce srt
-        "--output", output_template,
-        url
-    ]
-    
-    try:
-        logger.info(f"Attempting to download subtitles for {url} ({lang})...")
-        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        # Check if file exists
-        # yt-dlp might name it ytsub_temp.en.srt or similar
-        potential_files = glob.glob(os.path.join(output_dir, "ytsub_temp.*.srt"))
-        if potential_files:
-            return potential_files[0]
-            
-    except Exception as e:
-        logger.warning(f"Failed to download subtitles: {e}")
-    
-    return None
-
 def process_video(
     video_url_or_path: str, 
     output_dir: str, 
@@ -71,22 +18,32 @@ def process_video(
     """
     Download video from URL (or use local file) and generate subtitles.
     """
-    # 0. Prepare Resources
+    # Imported here so that `import video_scribe` stays cheap; these pull
+    # in yt_dlp, requests/tqdm and the ASR stack.
+    from .downloader import download_audio, fetch_subtitles
+    from .asr.factory import create_asr
+    from .resource_manager import ensure_all
+
+    # 0. Prepare Resources. Executable and model resolve concurrently:
+    # both downloads are independent and I/O bound, so a cold start
+    # waits for the slower one instead of the sum.
     logger.info("Step 0: Checking resources...")
-    exe_path = ensure_executable(faster_whisper_program)
-    
-    # Check if model_path is provided, else use default. 
-    # Also handle auto-download inside ensure_model
-    final_model_path = ensure_model(model_path if model_path else DEFAULT_MODEL_NAME)
-    
+    exe_path, final_model_path = ensure_all(
+        model_path if model_path else DEFAULT_MODEL_NAME, faster_whisper_program
+    )
+
     logger.info(f"Using Executable: {exe_path}")
     logger.info(f"Using Model: {final_model_path}")
 
-    # Step 0.5: Try to get existing YouTube subtitles (Optimization)
-    if not os.path.exists(video_url_or_path):
+    # Step 0.5: Try to get existing YouTube subtitles (Optimization).
+    # One in-process yt-dlp extraction serves both this check and, if no
+    # subtitles exist, the audio download below (video_info is reused).
+    video_info = None
+    is_youtube = any(domain in video_url_or_path for domain in ['youtube.com', 'youtu.be'])
+    if not os.path.exists(video_url_or_path) and is_youtube:
         target_lang = language if language else "en"
-        srt_path = try_download_youtube_subtitles(video_url_or_path, output_dir, target_lang)
-        
+        srt_path, video_info = fetch_subtitles(video_url_or_path, output_dir, target_lang)
+
         if srt_path:
             logger.info("Found YouTube subtitles! Skipping audio transcription.")
             try:
@@ -102,9 +59,7 @@ def process_video(
                 
                 # Export immediately
                 output_base = os.path.join(output_dir, video_id)
-                asr_data.save(output_base + ".srt")
-                asr_data.save(output_base + ".txt")
-                asr_data.save(output_base + ".json")
+                asr_data.save_all(output_base)
                 
                 # Cleanup temp srt
                 try: os.remove(srt_path)
@@ -122,7 +77,7 @@ def process_video(
         audio_path = video_url_or_path
     else:
         logger.info("Step 1: Downloading audio...")
-        audio_path = download_audio(video_url_or_path, output_dir)
+        audio_path = download_audio(video_url_or_path, output_dir, info=video_info)
     
     # 2. Config
     
@@ -148,10 +103,8 @@ def process_video(
     logger.info("Step 3: Exporting...")
     base_name = os.path.splitext(os.path.basename(audio_path))[0]
     output_base = os.path.join(output_dir, base_name)
-    
-    asr_data.save(output_base + ".srt")
-    asr_data.save(output_base + ".txt")
-    asr_data.save(output_base + ".json")
+
+    asr_data.save_all(output_base)
     
     logger.info("Done!")
     return asr_data
@@ -164,10 +117,11 @@ def optimize_subtitle(
     api_key: Optional[str] = None,
     base_url: Optional[str] = None,
     thread_num: int = 10,
-    batch_num: int = 10
+    batch_num: int = 10,
+    async_batch: bool = False
 ) -> ASRData:
     """Optimize subtitle content using LLM.
-    
+
     Args:
         subtitle_data: Path to subtitle file or ASRData object.
         model: LLM model to use.
@@ -176,19 +130,22 @@ def optimize_subtitle(
         base_url: OpenAI Base URL.
         thread_num: Number of concurrent threads.
         batch_num: Number of items per batch.
-        
+        async_batch: Use the provider's half-price async Batch endpoint
+            (up to 24h turnaround); for offline pipelines only.
+
     Returns:
         Optimized ASRData object.
     """
     from .optimize import SubtitleOptimizer
-    
+
     optimizer = SubtitleOptimizer(
         thread_num=thread_num,
         batch_num=batch_num,
         model=model,
         custom_prompt=custom_prompt,
         api_key=api_key,
-        base_url=base_url
+        base_url=base_url,
+        async_batch=async_batch
     )
     
     return optimizer.optimize_subtitle(subtitle_data)
@@ -3,9 +3,15 @@ import math
 import os
 import platform
 import re
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .utils import is_mainly_cjk
 
 # Multi-language word split pattern
@@ -22,12 +28,51 @@ _WORD_SPLIT_PATTERN = (
     r"|[\uac00-\ud7af]"  # Korean
 )
 
+# Large write buffer: subtitle exports are a few MB at most, so this
+# usually means one write syscall per file instead of one per 8KB.
+_IO_BUFFER = 16 << 20
+
+# Fixed-width digit lookup tables: a C-level dict hit beats int()'s
+# generic parse path when from_srt decodes eight numbers per block on
+# very large subtitle files. _D2 also carries one-digit keys because the
+# seconds field tolerates a single digit.
+_D2 = {f"{i:02d}": i for i in range(100)}
+_D2.update({str(i): i for i in range(10)})
+_D3 = {f"{i:03d}": i for i in range(1000)}
+
+# One compiled pattern matching a whole SRT block: index line, timestamps,
+# then text up to the next blank line. A single finditer scan in C replaces
+# the old split-into-blocks + per-block splitlines/match Python loops,
+# which dominate parse time on multi-MB transcripts.
+_SRT_BLOCK_PATTERN = re.compile(
+    r"^[^\n]*\n"
+    r"(\d{2}):(\d{2}):(\d{1,2})[.,](\d{3})\s-->\s(\d{2}):(\d{2}):(\d{1,2})[.,](\d{3})[^\n]*\n"
+    r"(.+?)(?=\n\s*\n|\Z)",
+    re.M | re.S,
+)
+
+
 def handle_long_path(path: str) -> str:
     if platform.system() == "Windows" and len(path) > 260 and not path.startswith(r"\\?\ "):
         return rf"\\?\{os.path.abspath(path)}"
     return path
 
+def _ms_to_srt_time(ms: int) -> str:
+    # Module-level (no per-call attribute lookup) and runs once per
+    # timestamp during export; // and % on ints beat the divmod chain,
+    # and the single int() up front keeps float inputs tolerated.
+    ms = int(ms)
+    h, rem = ms // 3600000, ms % 3600000
+    m, rem = rem // 60000, rem % 60000
+    s, msr = rem // 1000, rem % 1000
+    return f"{h:02d}:{m:02d}:{s:02d},{msr:03d}"
+
+
 class ASRDataSeg:
+    # Long videos produce tens of thousands of segments; slots drop the
+    # per-instance __dict__ and make attribute access a fixed-offset read.
+    __slots__ = ("text", "translated_text", "start_time", "end_time")
+
     def __init__(self, text: str, start_time: int, end_time: int, translated_text: str = ""):
         self.text = text
         self.translated_text = translated_text
@@ -35,34 +80,111 @@ class ASRDataSeg:
         self.end_time = end_time
 
     def to_srt_ts(self) -> str:
-        return f"{self._ms_to_srt_time(self.start_time)} --> {self._ms_to_srt_time(self.end_time)}"
+        return f"{_ms_to_srt_time(self.start_time)} --> {_ms_to_srt_time(self.end_time)}"
+
+    # Kept as an alias for any external callers of the old staticmethod.
+    _ms_to_srt_time = staticmethod(_ms_to_srt_time)
+
+# C-level sort key; a Python lambda adds a frame call per comparison.
+_GET_START = attrgetter("start_time")
 
-    @staticmethod
-    def _ms_to_srt_time(ms: int) -> str:
-        total_seconds, milliseconds = divmod(ms, 1000)
-        minutes, seconds = divmod(total_seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        return f"{int(hours):02}:{int(minutes):02}:{int(seconds):02},{int(milliseconds):03}"
 
 class ASRData:
     def __init__(self, segments: List[ASRDataSeg]):
         self.segments = [seg for seg in segments if seg.text and seg.text.strip()]
-        self.segments.sort(key=lambda x: x.start_time)
+        self.segments.sort(key=_GET_START)
 
     def save(self, save_path: str):
         save_path = handle_long_path(save_path)
         Path(save_path).parent.mkdir(parents=True, exist_ok=True)
 
+        # Stream segment-by-segment through the file buffer instead of
+        # materializing the whole document as one Python str first; on
+        # hour-long transcripts that string is the peak allocation.
         if save_path.endswith(".srt"):
-            self.to_srt(save_path=save_path)
+            with open(save_path, "w", encoding="utf-8", buffering=_IO_BUFFER) as f:
+                self._write_srt(f)
         elif save_path.endswith(".txt"):
-            self.to_txt(save_path=save_path)
+            with open(save_path, "w", encoding="utf-8", buffering=_IO_BUFFER) as f:
+                self._write_txt(f)
         elif save_path.endswith(".json"):
-             with open(save_path, "w", encoding="utf-8") as f:
-                json.dump(self.to_json(), f, ensure_ascii=False, indent=2)
+            # orjson encodes in C and emits bytes directly - one write()
+            # instead of json.dump's many small ones. Same output shape
+            # (2-space indent, non-ASCII kept as-is).
+            if orjson is not None:
+                Path(save_path).write_bytes(
+                    orjson.dumps(self.to_json(), option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(save_path, "w", encoding="utf-8") as f:
+                    json.dump(self.to_json(), f, ensure_ascii=False, indent=2)
         else:
             raise ValueError(f"Unsupported format: {save_path}")
 
+    def save_all(self, base_path: str, formats: Tuple[str, ...] = ("srt", "txt", "json")):
+        """Export several formats from a single pass over the segments.
+
+        ``base_path`` is the output path without extension. Compared with
+        calling save() per format this walks the segment list once and
+        fans each segment out to every open handle.
+        """
+        handles = {}
+        json_result = {} if "json" in formats else None
+        try:
+            for fmt in formats:
+                if fmt in ("srt", "txt"):
+                    path = handle_long_path(f"{base_path}.{fmt}")
+                    Path(path).parent.mkdir(parents=True, exist_ok=True)
+                    handles[fmt] = open(path, "w", encoding="utf-8", buffering=_IO_BUFFER)
+                elif fmt != "json":
+                    raise ValueError(f"Unsupported format: {fmt}")
+
+            srt_fp = handles.get("srt")
+            txt_fp = handles.get("txt")
+            for n, seg in enumerate(self.segments, 1):
+                if srt_fp is not None:
+                    if n > 1:
+                        srt_fp.write("\n")
+                    srt_fp.write(f"{n}\n{seg.to_srt_ts()}\n{seg.text}\n")
+                if txt_fp is not None:
+                    if n > 1:
+                        txt_fp.write("\n")
+                    txt_fp.write(seg.text)
+                if json_result is not None:
+                    json_result[str(n)] = {
+                        "start_time": seg.start_time,
+                        "end_time": seg.end_time,
+                        "text": seg.text,
+                    }
+        finally:
+            for fp in handles.values():
+                fp.close()
+
+        if json_result is not None:
+            json_path = handle_long_path(f"{base_path}.json")
+            Path(json_path).parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                Path(json_path).write_bytes(
+                    orjson.dumps(json_result, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(json_path, "w", encoding="utf-8") as f:
+                    json.dump(json_result, f, ensure_ascii=False, indent=2)
+
+    def _write_txt(self, fp):
+        """Write txt content incrementally; same bytes as to_txt()."""
+        for n, seg in enumerate(self.segments):
+            if n:
+                fp.write("\n")
+            fp.write(seg.text)
+
+    def _write_srt(self, fp):
+        """Write SRT content incrementally; same bytes as to_srt()."""
+        for n, seg in enumerate(self.segments, 1):
+            if n > 1:
+                fp.write("\n")
+            fp.write(f"{n}\n{seg.to_srt_ts()}\n{seg.text}\n")
+
     def to_txt(self, save_path=None) -> str:
         text = "\n".join([seg.text for seg in self.segments])
         if save_path:
@@ -71,9 +193,11 @@ class ASRData:
         return text
 
     def to_srt(self, save_path=None) -> str:
-        srt_lines = []
-        for n, seg in enumerate(self.segments, 1):
-            srt_lines.append(f"{n}\n{seg.to_srt_ts()}\n{seg.text}\n")
+        # Pre-sized list avoids append-triggered reallocations on 10k+
+        # segment transcripts; timestamps already use integer divmod.
+        srt_lines = [None] * len(self.segments)
+        for i, seg in enumerate(self.segments):
+            srt_lines[i] = f"{i + 1}\n{seg.to_srt_ts()}\n{seg.text}\n"
         srt_text = "\n".join(srt_lines)
         if save_path:
             with open(save_path, "w", encoding="utf-8") as f:
@@ -93,23 +217,12 @@ class ASRData:
     @staticmethod
     def from_srt(srt_str: str) -> "ASRData":
         segments = []
-        srt_time_pattern = re.compile(
-            r"(\d{2}):(\d{2}):(\d{1,2})[.,](\d{3})\s-->\s(\d{2}):(\d{2}):(\d{1,2})[.,](\d{3})"
-        )
-        blocks = re.split(r"\n\s*\n", srt_str.strip())
-        
-        for block in blocks:
-            lines = block.splitlines()
-            if len(lines) < 3: continue
-            
-            match = srt_time_pattern.match(lines[1])
-            if not match: continue
-            
-            time_parts = list(map(int, match.groups()))
-            start_time = time_parts[0]*3600000 + time_parts[1]*60000 + time_parts[2]*1000 + time_parts[3]
-            end_time = time_parts[4]*3600000 + time_parts[5]*60000 + time_parts[6]*1000 + time_parts[7]
-                
-            text = " ".join(lines[2:])
+        for match in _SRT_BLOCK_PATTERN.finditer(srt_str.strip()):
+            g = match.group
+            start_time = (_D2[g(1)] * 3600 + _D2[g(2)] * 60 + _D2[g(3)]) * 1000 + _D3[g(4)]
+            end_time = (_D2[g(5)] * 3600 + _D2[g(6)] * 60 + _D2[g(7)]) * 1000 + _D3[g(8)]
+
+            text = " ".join(g(9).splitlines())
             segments.append(ASRDataSeg(text, start_time, end_time))
-            
+
         return ASRData(segments)
@@ -5,10 +5,61 @@ from .utils import setup_logger
 
 logger = setup_logger("downloader")
 
-def download_audio(url: str, output_dir: str) -> str:
-    """Download audio from YouTube URL and return the file path."""
+# Keys added by a previous YoutubeDL processing pass; stripped before the
+# info dict is re-processed for the audio download.
+_PROCESSED_INFO_KEYS = ("requested_subtitles", "requested_formats", "requested_downloads", "__files_to_move")
+
+
+def fetch_subtitles(url: str, output_dir: str, lang: str = "en"):
+    """Try to fetch existing YouTube subtitles via the yt-dlp Python API.
+
+    Returns ``(srt_path, info)`` where ``srt_path`` is the downloaded .srt
+    file (or None if no usable subtitles exist) and ``info`` is the
+    extracted metadata. The caller can hand ``info`` to download_audio()
+    so the audio download reuses this metadata instead of re-hitting
+    YouTube for a second extraction round-trip.
+    """
     Path(output_dir).mkdir(parents=True, exist_ok=True)
-    
+
+    ydl_opts = {
+        'skip_download': True,
+        'writesubtitles': True,      # Try manual subs
+        'writeautomaticsub': True,   # Fallback to auto subs
+        'subtitleslangs': [lang],
+        'subtitlesformat': 'srt',
+        'outtmpl': os.path.join(output_dir, 'ytsub_temp.%(ext)s'),
+        'quiet': True,
+        'no_warnings': True,
+    }
+
+    info = None
+    try:
+        logger.info(f"Attempting to download subtitles for {url} ({lang})...")
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+    except Exception as e:
+        logger.warning(f"Failed to download subtitles: {e}")
+        return None, info
+
+    # yt-dlp reports the written path directly; no directory scan (or
+    # pre-emptive ytsub_temp.* cleanup) needed to locate the file.
+    for sub in ((info or {}).get('requested_subtitles') or {}).values():
+        filepath = sub.get('filepath')
+        if filepath and filepath.endswith('.srt') and os.path.exists(filepath):
+            return filepath, info
+
+    return None, info
+
+
+def download_audio(url: str, output_dir: str, info: dict = None) -> str:
+    """Download audio from YouTube URL and return the file path.
+
+    If ``info`` (from fetch_subtitles) is given, the already-extracted
+    metadata is re-processed instead of re-querying YouTube, saving one
+    extractor round-trip per video.
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
     ydl_opts = {
         'format': 'bestaudio/best',
         'postprocessors': [{
@@ -20,11 +71,15 @@ def download_audio(url: str, output_dir: str) -> str:
         'quiet': True,
         'no_warnings': True,
     }
-    
+
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         logger.info(f"Downloading audio from {url}...")
         try:
-            info = ydl.extract_info(url, download=True)
+            if info is not None:
+                reused = {k: v for k, v in info.items() if k not in _PROCESSED_INFO_KEYS}
+                info = ydl.process_ie_result(reused, download=True)
+            else:
+                info = ydl.extract_info(url, download=True)
             filename = ydl.prepare_filename(info)
             # yt-dlp with postprocessor changes extension
             final_filename = Path(filename).with_suffix('.wav')
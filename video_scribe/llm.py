@@ -4,16 +4,13 @@ import os
 from typing import Any, List, Optional
 from urllib.parse import urlparse, urlunparse
 
-from openai import OpenAI
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_random_exponential,
-)
-
+from .llm_pool import acquire as _acquire_request_budget
 from .utils import setup_logger
 
+# openai/httpx/tenacity are imported inside the functions below: they
+# dominate this package's cold-start time (import openai alone is
+# 100-300ms) and transcribe-only runs never touch the LLM at all.
+
 logger = setup_logger("llm_client")
 
 def normalize_base_url(base_url: str) -> str:
@@ -38,44 +35,73 @@ def normalize_base_url(base_url: str) -> str:
 
     return normalized
 
+# One transport shared by every OpenAI client: keep-alive connections
+# survive credential-triggered client rebuilds, and the limits let each
+# optimizer worker thread hold its own pooled connection. HTTP/2
+# multiplexing was considered and skipped - it needs the optional h2
+# extra and the win over pooled keep-alive HTTP/1.1 is marginal at ~10
+# concurrent requests. Timeout matches the openai default.
+_http_client = None
+
+
+def _get_http_client():
+    global _http_client
+    if _http_client is None:
+        try:
+            import httpx
+        except ImportError:  # newer openai releases vendor the httpx2 fork instead
+            import httpx2 as httpx
+        from openai import DefaultHttpxClient
+
+        _http_client = DefaultHttpxClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+            timeout=600.0,
+        )
+    return _http_client
+
+
 _client = None
+_client_key = None
 
-def get_llm_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> OpenAI:
+def get_llm_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> "OpenAI":
     """Get OpenAI client instance.
-    
+
+    The client (and its httpx connection pool) is cached and only rebuilt
+    when the effective credentials actually change. Callers routinely pass
+    api_key/base_url on every call; recreating the client each time would
+    drop keep-alive connections and pay a TCP+TLS handshake per request.
+
     Args:
         api_key: OpenAI API key. If None, reads from OPENAI_API_KEY env var.
         base_url: OpenAI Base URL. If None, reads from OPENAI_BASE_URL env var.
     """
-    global _client
-    
-    # Allow re-initialization if keys are provided
-    if api_key or base_url or _client is None:
-        final_api_key = api_key or os.getenv("OPENAI_API_KEY", "").strip()
-        final_base_url = base_url or os.getenv("OPENAI_BASE_URL", "").strip()
-        
-        if final_base_url:
-            final_base_url = normalize_base_url(final_base_url)
+    global _client, _client_key
+
+    from openai import OpenAI
+
+    final_api_key = api_key or os.getenv("OPENAI_API_KEY", "").strip()
+    final_base_url = base_url or os.getenv("OPENAI_BASE_URL", "").strip()
 
+    if final_base_url:
+        final_base_url = normalize_base_url(final_base_url)
+
+    key = (final_api_key, final_base_url)
+    if _client is None or key != _client_key:
         if not final_api_key:
-             # Even if no key is found, we might want to return a client if it works without one (e.g. local LLMs), 
+             # Even if no key is found, we might want to return a client if it works without one (e.g. local LLMs),
              # but standard OpenAI requires it. We'll warn but proceed.
              logger.warning("OPENAI_API_KEY is not set.")
 
         _client = OpenAI(
             base_url=final_base_url if final_base_url else None,
             api_key=final_api_key,
+            http_client=_get_http_client(),
         )
+        _client_key = key
 
     return _client
 
-@retry(
-    stop=stop_after_attempt(5),
-    wait=wait_random_exponential(multiplier=1, min=2, max=30),
-    retry=retry_if_exception_type(Exception), # Broad retry for network/API issues, can be refined
-    reraise=True
-)
-def call_llm(
+def _call_llm_once(
     messages: List[dict],
     model: str,
     temperature: float = 0.2,
@@ -83,9 +109,12 @@ def call_llm(
     base_url: Optional[str] = None,
     **kwargs: Any,
 ) -> Any:
-    """Call LLM API with retry logic."""
     client = get_llm_client(api_key, base_url)
 
+    # Wait for request budget (if VIDEO_SCRIBE_LLM_RPM is set) rather
+    # than sending a call destined for a 429; each retry re-acquires.
+    _acquire_request_budget()
+
     try:
         response = client.chat.completions.create(
             model=model,
@@ -97,3 +126,36 @@ def call_llm(
     except Exception as e:
         logger.error(f"LLM call failed: {e}")
         raise
+
+
+_retrying_call = None
+
+
+def call_llm(
+    messages: List[dict],
+    model: str,
+    temperature: float = 0.2,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    **kwargs: Any,
+) -> Any:
+    """Call LLM API with retry logic."""
+    global _retrying_call
+    if _retrying_call is None:
+        # Built on first call so tenacity is only imported when the LLM
+        # is actually used. A benign race: two threads may build the
+        # wrapper twice, the second assignment wins.
+        from tenacity import (
+            retry,
+            retry_if_exception_type,
+            stop_after_attempt,
+            wait_random_exponential,
+        )
+
+        _retrying_call = retry(
+            stop=stop_after_attempt(5),
+            wait=wait_random_exponential(multiplier=1, min=2, max=30),
+            retry=retry_if_exception_type(Exception),  # Broad retry for network/API issues, can be refined
+            reraise=True,
+        )(_call_llm_once)
+    return _retrying_call(messages, model, temperature, api_key, base_url, **kwargs)
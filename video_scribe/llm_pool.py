@@ -0,0 +1,63 @@
+"""Request rate limiting for LLM calls.
+
+A token bucket sized to the provider's requests-per-minute contract
+stops us from firing calls that are destined for a 429: instead of
+paying the round-trip plus tenacity's exponential backoff, callers
+block locally just long enough for budget to free up.
+"""
+
+import os
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until budget is free.
+
+    Refills continuously at ``rate_per_minute / 60`` tokens per second.
+    The default capacity allows roughly a ten-second burst so a batch of
+    workers starting at once is not serialized one call per tick.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_minute / 6.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_bucket = None
+_bucket_lock = threading.Lock()
+
+
+def acquire(tokens: float = 1.0) -> None:
+    """Block until the global request budget allows another LLM call.
+
+    A no-op unless VIDEO_SCRIBE_LLM_RPM is set (requests per minute for
+    the configured provider/key). The bucket is shared process-wide so
+    every optimizer thread draws from the same budget.
+    """
+    global _bucket
+    rpm = os.getenv("VIDEO_SCRIBE_LLM_RPM")
+    if not rpm:
+        return
+    if _bucket is None:
+        with _bucket_lock:
+            if _bucket is None:
+                _bucket = TokenBucket(float(rpm))
+    _bucket.acquire(tokens)
@@ -1,60 +1,304 @@
 import os
+import shutil
+import socket
 import sys
 import zipfile
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from tqdm import tqdm
+from typing import Tuple
 
 from .utils import setup_logger
 from .config import DEFAULT_BIN_DIR, DEFAULT_MODEL_DIR, FASTER_WHISPER_XXL_URL
 
 logger = setup_logger("resource_manager")
 
+# requests and tqdm are imported lazily below: this module is loaded on
+# every transcribe run but only downloads anything on first use, and the
+# optimize/--help CLI paths never need either.
+
+# 1 MiB blocks: the whisper archive is hundreds of MB, and 1 KiB chunks
+# meant ~1M write syscalls and tqdm updates per GiB. Progress updates are
+# further batched to every ~4 MiB to skip tqdm's per-call locking.
+_DOWNLOAD_BLOCK = 1 << 20
+_BAR_UPDATE_BYTES = 4 << 20
+
+# Ranged (multi-connection) download: servers often throttle per
+# connection, so splitting a large file into N ranged GETs recovers
+# bandwidth roughly proportional to N. Only used when the server
+# advertises Accept-Ranges and the file is big enough to amortize the
+# extra connections.
+_RANGE_WORKERS = 8
+_RANGE_MIN_SIZE = 8 << 20
+
+_SESSION = None
+
+
+def _get_session():
+    """One session for all resource downloads, built on first use.
+
+    TLS handshakes are amortized across the redirect hops (the GitHub
+    release URL redirects twice) and across the ranged-download workers,
+    which otherwise each open a fresh connection. Pool sized for the
+    range workers, with retries for transient failures and a 4 MiB
+    socket receive buffer so the kernel hands iter_content fuller reads.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        class _LargeRecvAdapter(HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs["socket_options"] = [(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)]
+                super().init_poolmanager(*args, **kwargs)
+
+        _SESSION = requests.Session()
+        _SESSION.mount(
+            "https://",
+            _LargeRecvAdapter(
+                pool_connections=4,
+                pool_maxsize=_RANGE_WORKERS,
+                max_retries=Retry(total=3, backoff_factor=0.3),
+            ),
+        )
+    return _SESSION
+
+
+def _progress_bar(save_path: str, total_size: int):
+    """Progress bar tuned so refreshes stay off the write path.
+
+    Updates already arrive batched (~4 MiB); mininterval/miniters rate-
+    limit the redraws on top of that, smoothing=0 skips the EMA rate
+    estimate, and a fixed width avoids re-querying the terminal size.
+    """
+    from tqdm import tqdm
+
+    return tqdm(
+        desc=os.path.basename(save_path),
+        total=total_size,
+        unit='iB',
+        unit_scale=True,
+        unit_divisor=1024,
+        mininterval=0.25,
+        miniters=1 << 20,
+        smoothing=0,
+        dynamic_ncols=False,
+        ncols=80,
+        leave=False,
+    )
+
+
+class _RangeUnsupported(Exception):
+    """Server answered a Range request with a full 200 body."""
+
+
+class _ProgressWriter:
+    """File shim that feeds tqdm from copyfileobj's writes.
+
+    copyfileobj drives the copy loop in C; this intercepts each write to
+    batch progress updates the same way the other download paths do.
+    """
+
+    def __init__(self, fp, bar):
+        self._fp = fp
+        self._bar = bar
+        self._pending = 0
+
+    def write(self, data):
+        n = self._fp.write(data)
+        self._pending += n
+        if self._pending >= _BAR_UPDATE_BYTES:
+            self._bar.update(self._pending)
+            self._pending = 0
+        return n
+
+    def flush_progress(self):
+        if self._pending:
+            self._bar.update(self._pending)
+            self._pending = 0
+
+
+def _download_ranged(url: str, save_path: str, total_size: int):
+    """Fetch ``url`` over several ranged connections into one file.
+
+    The output is pre-allocated and each worker streams its byte range
+    directly to its own offset with os.pwrite, so no merge pass is
+    needed. tqdm.update is thread-safe (internal lock); updates are
+    batched per worker like the single-stream path.
+    """
+    fd = os.open(save_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, total_size)
+        else:
+            os.ftruncate(fd, total_size)
+
+        with _progress_bar(save_path, total_size) as bar:
+
+            def fetch(start: int, end: int):
+                response = _get_session().get(
+                    url,
+                    headers={"Range": f"bytes={start}-{end}"},
+                    stream=True,
+                    timeout=30,
+                )
+                response.raise_for_status()
+                if response.status_code != 206:
+                    # Accept-Ranges in the HEAD response does not
+                    # guarantee GET honors Range; writing a 200 full
+                    # body at this worker's offset would corrupt the
+                    # file. Bail before writing anything.
+                    response.close()
+                    raise _RangeUnsupported(url)
+                offset = start
+                pending = 0
+                for data in response.iter_content(_DOWNLOAD_BLOCK):
+                    os.pwrite(fd, data, offset)
+                    offset += len(data)
+                    pending += len(data)
+                    if pending >= _BAR_UPDATE_BYTES:
+                        bar.update(pending)
+                        pending = 0
+                if pending:
+                    bar.update(pending)
+
+            part = -(-total_size // _RANGE_WORKERS)
+            with ThreadPoolExecutor(max_workers=_RANGE_WORKERS) as executor:
+                futures = [
+                    executor.submit(fetch, start, min(start + part, total_size) - 1)
+                    for start in range(0, total_size, part)
+                ]
+                for future in as_completed(futures):
+                    future.result()
+    finally:
+        os.close(fd)
+
+
 def download_file(url: str, save_path: str):
-    """Download a file with progress bar."""
+    """Download a file with progress bar.
+
+    Files whose server supports byte ranges are fetched over several
+    parallel connections; everything else streams over one connection.
+    """
     Path(save_path).parent.mkdir(parents=True, exist_ok=True)
-    
+
     try:
-        response = requests.get(url, stream=True, timeout=30)
+        total_size = 0
+        accept_ranges = False
+        try:
+            head = _get_session().head(url, timeout=30, allow_redirects=True)
+            head.raise_for_status()
+            total_size = int(head.headers.get('content-length', 0))
+            accept_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+        except Exception:
+            pass  # HEAD unsupported; the plain GET below still works
+
+        if accept_ranges and total_size >= _RANGE_MIN_SIZE and hasattr(os, "pwrite"):
+            try:
+                _download_ranged(url, save_path, total_size)
+                return
+            except _RangeUnsupported:
+                logger.warning(
+                    f"Server ignored the Range header for {url}; "
+                    "falling back to a single-stream download."
+                )
+
+        response = _get_session().get(url, stream=True, timeout=30)
         response.raise_for_status()
-        
+
         total_size = int(response.headers.get('content-length', 0))
-        block_size = 1024 # 1KB
-        
-        with open(save_path, 'wb') as f, tqdm(
-            desc=os.path.basename(save_path),
-            total=total_size,
-            unit='iB',
-            unit_scale=True,
-            unit_divisor=1024,
-        ) as bar:
-            for data in response.iter_content(block_size):
-                size = f.write(data)
-                bar.update(size)
-                
+
+        with open(save_path, 'wb', buffering=_DOWNLOAD_BLOCK) as f, \
+                _progress_bar(save_path, total_size) as bar:
+            # Pre-allocate when the size is known: the filesystem lays
+            # the archive out contiguously instead of growing extents
+            # write-by-write (the ranged path does the same). Best
+            # effort - tmpfs and some filesystems report EOPNOTSUPP.
+            if total_size > 0 and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(f.fileno(), 0, total_size)
+                except OSError:
+                    pass
+            # copyfileobj keeps the copy loop in C instead of allocating
+            # a bytes object per iter_content chunk; decode_content keeps
+            # gzip-encoded bodies handled like iter_content did.
+            response.raw.decode_content = True
+            writer = _ProgressWriter(f, bar)
+            shutil.copyfileobj(response.raw, writer, length=_DOWNLOAD_BLOCK)
+            writer.flush_progress()
+            # Trim the pre-allocation if the decoded body came up short
+            # (content-length counts the encoded bytes).
+            f.truncate()
+
     except Exception as e:
         logger.error(f"Failed to download {url}: {e}")
         if os.path.exists(save_path):
             os.remove(save_path)
         raise e
 
+# Path-existence cache for the ensure_* resolution logic: each lookup is
+# a stat syscall and the same handful of paths is probed repeatedly.
+# Must be cleared after anything that mutates the checked paths
+# (downloads, extraction, renames).
+@lru_cache(maxsize=256)
+def _exists(path: str) -> bool:
+    return os.path.exists(path)
+
+
+def _extract_7z(archive_path: str, dest_dir: str):
+    """Extract a .7z archive, in-process via py7zr when available.
+
+    py7zr skips the fork/exec and the "7z not in PATH" failure mode of
+    the system binary; that subprocess path is kept as the fallback when
+    py7zr is not installed. Extraction is sequential on purpose: these
+    archives are solid-compressed, so parallel per-member extraction
+    would decompress the same solid block once per worker.
+    """
+    try:
+        import py7zr
+    except ImportError:
+        py7zr = None
+
+    if py7zr is not None:
+        logger.info("Extracting 7z archive with py7zr...")
+        with py7zr.SevenZipFile(archive_path, mode="r") as z:
+            z.extractall(path=dest_dir)
+        return
+
+    logger.info("Extracting 7z archive using system 7z...")
+    import subprocess
+    try:
+        subprocess.run(
+            ["7z", "x", archive_path, f"-o{dest_dir}", "-y"],
+            check=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        logger.error(f"Extraction failed: {e}. Please ensure '7z' is installed and in your PATH.")
+        raise RuntimeError("Failed to extract 7z archive. Please install 'py7zr' or 7-Zip.")
+
+# Resolved paths never change within a process, so batch runs (many
+# videos, one process) skip the repeated stat/download checks. lru_cache
+# only stores successful returns; a failed resolution is retried.
+@lru_cache(maxsize=None)
 def ensure_executable(program_path: str = None) -> str:
     """
     Ensure faster-whisper-xxl executable exists.
     If program_path is provided, checks if it exists.
     If not, checks default location or downloads it.
     """
-    if program_path and os.path.exists(program_path):
+    if program_path and _exists(program_path):
         return program_path
     
     # Check default location
     default_exe = os.path.join(DEFAULT_BIN_DIR, "faster-whisper-xxl.exe")
-    if os.path.exists(default_exe):
+    if _exists(default_exe):
         return default_exe
     
     # Check GPU version location (in subdirectory)
     gpu_exe = os.path.join(DEFAULT_BIN_DIR, "Faster-Whisper-XXL", "faster-whisper-xxl.exe")
-    if os.path.exists(gpu_exe):
+    if _exists(gpu_exe):
         return gpu_exe
     
     # Download
@@ -65,40 +309,33 @@ def ensure_executable(program_path: str = None) -> str:
     download_path = os.path.join(DEFAULT_BIN_DIR, filename)
     
     try:
-        if not os.path.exists(download_path):
+        if not _exists(download_path):
              download_file(FASTER_WHISPER_XXL_URL, download_path)
-        
+             _exists.cache_clear()
+
         # Extract if it's a 7z archive
         if download_path.endswith(".7z"):
-            logger.info("Extracting 7z archive using system 7z...")
-            import subprocess
-            try:
-                subprocess.run(
-                    ["7z", "x", download_path, f"-o{DEFAULT_BIN_DIR}", "-y"], 
-                    check=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
-                )
-            except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                logger.error(f"Extraction failed: {e}. Please ensure '7z' is installed and in your PATH.")
-                raise RuntimeError("Failed to extract 7z archive. Please install 7-Zip.")
-            
+            _extract_7z(download_path, DEFAULT_BIN_DIR)
+            _exists.cache_clear()
+
             # Cleanup archive? Maybe keep it for cache.
             # After extraction, the exe should be at .../Faster-Whisper-XXL/faster-whisper-xxl.exe
             # We need to find it and maybe move it or return that path.
             extracted_subdir = os.path.join(DEFAULT_BIN_DIR, "Faster-Whisper-XXL", "faster-whisper-xxl.exe")
-            if os.path.exists(extracted_subdir):
+            if _exists(extracted_subdir):
                 return extracted_subdir
             
             # Some archives extract directly, check again default location
-            if os.path.exists(default_exe):
+            if _exists(default_exe):
                 return default_exe
 
         # If it was an exe download (CPU version)
         if download_path.endswith(".exe"):
              # Rename if needed or just return it
              if download_path != default_exe:
-                 if os.path.exists(default_exe): os.remove(default_exe)
+                 if _exists(default_exe): os.remove(default_exe)
                  os.rename(download_path, default_exe)
+                 _exists.cache_clear()
              return default_exe
 
         return default_exe
@@ -106,17 +343,18 @@ def ensure_executable(program_path: str = None) -> str:
         logger.warning(f"Automatic download/extraction failed: {e}")
         raise RuntimeError("Could not setup faster-whisper-xxl.")
 
+@lru_cache(maxsize=None)
 def ensure_model(model_name: str = "tiny") -> str:
     """
     Check if model exists locally, else download using ModelScope or HuggingFace.
     Returns the absolute path to the model directory.
     """
     # Check if user provided a full path
-    if os.path.exists(model_name):
+    if _exists(model_name):
         return model_name
         
     model_dir = os.path.join(DEFAULT_MODEL_DIR, f"faster-whisper-{model_name}")
-    if os.path.exists(model_dir) and os.listdir(model_dir):
+    if _exists(model_dir) and os.listdir(model_dir):
         return model_dir
         
     logger.info(f"Model {model_name} not found locally. Downloading to {model_dir}...")
@@ -140,10 +378,23 @@ def ensure_model(model_name: str = "tiny") -> str:
     # Fallback to faster_whisper library's download logic?
     # Or just use huggingface_hub
     try:
+        # hf_transfer is huggingface_hub's Rust download backend
+        # (multi-threaded range requests); opt in when it is installed,
+        # but leave any explicit user setting alone.
+        try:
+            import hf_transfer  # noqa: F401
+            os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+        except ImportError:
+            pass
         from huggingface_hub import snapshot_download
         logger.info("Using HuggingFace for download...")
         hf_model_id = f"Systran/faster-whisper-{model_name}"
-        path = snapshot_download(repo_id=hf_model_id, local_dir=model_dir)
+        path = snapshot_download(
+            repo_id=hf_model_id,
+            local_dir=model_dir,
+            max_workers=16,
+            etag_timeout=5,
+        )
         return path
     except ImportError:
          pass
@@ -153,3 +404,16 @@ def ensure_model(model_name: str = "tiny") -> str:
         "Please install 'modelscope' or 'huggingface_hub', \n"
         "or manually download the model to 'video_scribe/models/'."
     )
+
+
+def ensure_all(model_name: str = "tiny", program_path: str = None) -> Tuple[str, str]:
+    """Resolve executable and model concurrently.
+
+    Both downloads are independent and I/O bound, so the cold-start case
+    (neither present) waits for the slower of the two instead of their
+    sum. Returns ``(exe_path, model_path)``.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        exe_future = executor.submit(ensure_executable, program_path)
+        model_future = executor.submit(ensure_model, model_name)
+        return exe_future.result(), model_future.result()
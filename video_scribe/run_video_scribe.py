@@ -6,9 +6,12 @@ from pathlib import Path
 # Ensure the root directory (parent of video_scribe) is in sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from video_scribe import process_video, optimize_subtitle
+# video_scribe imports happen inside each command handler so that
+# argument parsing (and --help) pays none of the package import cost.
 
 def run_transcribe(args):
+    from video_scribe import process_video
+
     print(f"Processing {args.input}...")
     try:
         process_video(
@@ -26,6 +29,8 @@ def run_transcribe(args):
         traceback.print_exc()
 
 def run_optimize(args):
+    from video_scribe import optimize_subtitle
+
     print(f"Optimizing {args.input}...")
     try:
         if not os.path.exists(args.input):
@@ -61,6 +66,8 @@ def run_optimize(args):
 
 def run_auto_transcribe(args):
     """Run transcription with hardcoded default parameters."""
+    from video_scribe import process_video
+
     print("Running in AUTO TRANSCRIBE mode with default parameters...")
     
     # --- Configuration for AUTO TRANSCRIBE mode ---
@@ -85,6 +92,8 @@ def run_auto_transcribe(args):
 
 def run_auto_optimize(args):
     """Run optimization with hardcoded default parameters."""
+    from video_scribe import optimize_subtitle
+
     print("Running in AUTO OPTIMIZE mode with default parameters...")
 
     # --- Configuration for AUTO OPTIMIZE mode ---
@@ -1,36 +1,119 @@
-import queue
+import collections
+import os
+import selectors
 import subprocess
+import sys
 import threading
 from typing import Optional, Tuple
 
+
 class StreamReader:
-    """Generic subprocess output stream reader."""
+    """Generic subprocess output stream reader.
+
+    One daemon thread polls the child's stdout/stderr pipes with
+    selectors, draining 64 KiB per read and splitting into lines, instead
+    of one readline-looping thread per stream pushing into a Queue. That
+    removes two context switches and a queue lock acquire per output
+    line, and get_output wakes on an Event the moment a line lands
+    rather than sitting on a 100 ms poll. Lines are decoded UTF-8
+    (errors replaced) with the trailing newline stripped.
+
+    On Windows select() cannot poll pipes, so the per-stream reader
+    threads are kept there; the consumer-facing behaviour is identical.
+    """
+
+    _READ_SIZE = 64 * 1024
 
     def __init__(self, process: subprocess.Popen):
         self.process = process
-        self.output_queue = queue.Queue()
+        # deque.extend/popleft are atomic under the GIL, so producer and
+        # consumers need no lock of their own; the Event only signals
+        # "something was appended" for blocking get_output calls.
+        self._lines = collections.deque()
+        self._available = threading.Event()
         self.threads = []
 
     def start_reading(self) -> None:
-        if self.process.stdout:
-            stdout_thread = threading.Thread(
-                target=self._read_stream, args=(self.process.stdout, "stdout"), daemon=True
-            )
-            stdout_thread.start()
-            self.threads.append(stdout_thread)
-
-        if self.process.stderr:
-            stderr_thread = threading.Thread(
-                target=self._read_stream, args=(self.process.stderr, "stderr"), daemon=True
-            )
-            stderr_thread.start()
-            self.threads.append(stderr_thread)
+        if sys.platform == "win32":
+            for name in ("stdout", "stderr"):
+                stream = getattr(self.process, name)
+                if stream:
+                    thread = threading.Thread(
+                        target=self._read_stream, args=(stream, name), daemon=True
+                    )
+                    thread.start()
+                    self.threads.append(thread)
+        else:
+            thread = threading.Thread(target=self._read_streams, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _push(self, stream_name: str, raw_lines: list) -> None:
+        self._lines.extend(
+            (stream_name, line.decode("utf-8", errors="replace"))
+            for line in raw_lines
+        )
+        self._available.set()
+
+    def _read_streams(self) -> None:
+        """Single-thread selectors loop over both pipes (POSIX)."""
+        sel = selectors.DefaultSelector()
+        buffers = {}
+        streams = {}
+        for name in ("stdout", "stderr"):
+            stream = getattr(self.process, name)
+            if stream:
+                fd = stream.fileno()
+                os.set_blocking(fd, False)
+                sel.register(fd, selectors.EVENT_READ, name)
+                buffers[fd] = bytearray()
+                streams[fd] = stream
+        try:
+            while buffers:
+                for key, _ in sel.select(0.05):
+                    fd = key.fd
+                    try:
+                        data = os.read(fd, self._READ_SIZE)
+                    except (BlockingIOError, InterruptedError):
+                        continue
+                    except OSError:
+                        data = b""
+                    if not data:
+                        # EOF: flush any unterminated tail and drop the fd.
+                        tail = buffers.pop(fd)
+                        sel.unregister(fd)
+                        if tail:
+                            self._push(key.data, [bytes(tail)])
+                        continue
+                    buf = buffers[fd]
+                    buf += data
+                    *lines, rest = buf.split(b"\n")
+                    if lines:
+                        buffers[fd] = bytearray(rest)
+                        self._push(key.data, lines)
+        except Exception:
+            pass
+        finally:
+            sel.close()
+            for stream in streams.values():
+                stream.close()
 
     def _read_stream(self, stream, stream_name: str) -> None:
+        """Per-stream fallback reader (Windows)."""
         try:
-            for line in iter(stream.readline, ""):
-                if line:
-                    self.output_queue.put((stream_name, line))
+            buffer = bytearray()
+            fd = stream.fileno()
+            while True:
+                data = os.read(fd, self._READ_SIZE)
+                if not data:
+                    if buffer:
+                        self._push(stream_name, [bytes(buffer)])
+                    break
+                buffer += data
+                *lines, rest = buffer.split(b"\n")
+                if lines:
+                    buffer = bytearray(rest)
+                    self._push(stream_name, lines)
         except Exception:
             pass
         finally:
@@ -38,15 +121,27 @@ class StreamReader:
 
     def get_output(self, timeout: float = 0.1) -> Optional[Tuple[str, str]]:
         try:
-            return self.output_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+            return self._lines.popleft()
+        except IndexError:
+            pass
+        # Empty: clear the flag, then re-check to close the race with a
+        # push that landed between the popleft and the clear.
+        self._available.clear()
+        try:
+            return self._lines.popleft()
+        except IndexError:
+            pass
+        if self._available.wait(timeout):
+            try:
+                return self._lines.popleft()
+            except IndexError:
+                pass
+        return None
 
     def get_remaining_output(self) -> list:
         output = []
-        while not self.output_queue.empty():
+        while True:
             try:
-                output.append(self.output_queue.get_nowait())
-            except queue.Empty:
-                break
-        return output
+                output.append(self._lines.popleft())
+            except IndexError:
+                return output